@@ -1,19 +1,73 @@
 """Async database engine and session factory."""
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import asyncpg
+import orjson
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import NullPool
 
 from app.core.config import settings
 
-engine = create_async_engine(
-    settings.database_url,
-    echo=False,
-    pool_size=10,
-    max_overflow=20,
-)
+# Server-side prepared statements are cached per connection: asyncpg's own
+# cache serves raw-driver queries, SQLAlchemy's adapter cache serves
+# session.execute(). Transaction-mode pgbouncer can't keep prepared
+# statements across transactions, so both are disabled there.
+_STATEMENT_CACHE_SIZE = 0 if settings.db_behind_pgbouncer else 2048
+_PREPARED_STATEMENT_CACHE_SIZE = 0 if settings.db_behind_pgbouncer else 512
+
+if settings.db_behind_pgbouncer:
+    _pool_options: dict = {"poolclass": NullPool}
+else:
+    _pool_options = {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        # Recycle before NAT/pgbouncer idle timeouts silently drop the socket,
+        # and ping on checkout so a dead connection never reaches a request
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": True,
+    }
+
+
+def _create_engine(url: str) -> AsyncEngine:
+    """Build an asyncpg engine with the shared pool and connection settings."""
+    return create_async_engine(
+        url,
+        echo=False,
+        connect_args={
+            "statement_cache_size": _STATEMENT_CACHE_SIZE,
+            "prepared_statement_cache_size": _PREPARED_STATEMENT_CACHE_SIZE,
+            "server_settings": {
+                "application_name": "forest-explorer",
+                # Dashboard queries are short; JIT compile time outweighs any gain
+                "jit": "off",
+            },
+        },
+        # The asyncpg dialect installs these as the json/jsonb codecs on every
+        # connection; orjson decodes geometry-heavy payloads several times faster
+        json_serializer=lambda obj: orjson.dumps(obj).decode(),
+        json_deserializer=orjson.loads,
+        **_pool_options,
+    )
+
+
+engine = _create_engine(settings.database_url)
+
+# Read-only engine: asyncpg opens its transactions as BEGIN READ ONLY (no
+# extra round trip). Without a replica URL it is a view over the primary pool.
+engine_ro = (
+    _create_engine(settings.database_url_ro) if settings.database_url_ro else engine
+).execution_options(postgresql_readonly=True)
 
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+async_session_ro = async_sessionmaker(engine_ro, class_=AsyncSession, expire_on_commit=False)
 
 
 async def get_db() -> AsyncGenerator[AsyncSession]:
@@ -25,3 +79,39 @@ async def get_db() -> AsyncGenerator[AsyncSession]:
         except Exception:
             await session.rollback()
             raise
+
+
+async def get_db_ro() -> AsyncGenerator[AsyncSession]:
+    """FastAPI dependency yielding a read-only session for GET endpoints.
+
+    Never commits: the transaction is simply rolled back when the session closes.
+    """
+    async with async_session_ro() as session:
+        yield session
+
+
+async def get_driver_connection(session: AsyncSession) -> asyncpg.Connection:
+    """Return the raw asyncpg connection behind a session.
+
+    For hot paths that emit many rows or one large value: asyncpg Records skip
+    SQLAlchemy's Row/Result wrapping, and queries use $1-style parameters.
+    """
+    conn = await session.connection()
+    raw = await conn.get_raw_connection()
+    return raw.driver_connection
+
+
+@asynccontextmanager
+async def driver_connection_ro(session: AsyncSession) -> AsyncIterator[asyncpg.Connection]:
+    """Raw asyncpg connection behind a read-only session, inside BEGIN READ ONLY.
+
+    SQLAlchemy's adapter only sends its BEGIN READ ONLY when a statement goes
+    through it, so raw driver calls would otherwise run in autocommit. If the
+    session has already begun its (read-only) transaction, that one is reused.
+    """
+    conn = await get_driver_connection(session)
+    if conn.is_in_transaction():
+        yield conn
+    else:
+        async with conn.transaction(readonly=True):
+            yield conn
@@ -16,15 +16,24 @@ import argparse
 import logging
 import tempfile
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import httpx
 import numpy as np
 import pandas as pd
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 
-from app.core.config import settings
-from app.ingestion.fia_loader import STATE_CODES
+from app.ingestion.fia_loader import (
+    STATE_CODES,
+    _copy_dataframe,
+    make_engine,
+    make_http_client,
+)
+
+if TYPE_CHECKING:
+    from affine import Affine
 
 logger = logging.getLogger(__name__)
 
@@ -36,18 +45,20 @@ PRISM_VARS = {
     "tmean_jan": f"{PRISM_BASE}/tmean/1",  # January mean temp
     "tmean_jul": f"{PRISM_BASE}/tmean/7",  # July mean temp
 }
+# Monthly precip for the growing season, Apr=4 through Sep=9
+GROWING_SEASON_PPT = {f"ppt_{month:02d}": f"{PRISM_BASE}/ppt/{month}" for month in range(4, 10)}
+
+# Rasters are fetched concurrently; small enough to stay polite to PRISM
+DOWNLOAD_WORKERS = 5
 
 
-def _download_prism_bil(url: str, label: str) -> Path:
+def _download_prism_bil(client: httpx.Client, url: str, label: str) -> Path:
     """Download a PRISM BIL zip file and extract the .bil raster."""
     tmp_dir = tempfile.mkdtemp(prefix=f"prism_{label}_")
     zip_path = Path(tmp_dir) / "prism.zip"
     logger.info(f"Downloading PRISM {label} from {url}")
 
-    with (
-        httpx.Client(timeout=httpx.Timeout(30, read=300), follow_redirects=True) as client,
-        client.stream("GET", url) as resp,
-    ):
+    with client.stream("GET", url) as resp:
         resp.raise_for_status()
         with open(zip_path, "wb") as f:
             for chunk in resp.iter_bytes(chunk_size=1024 * 1024):
@@ -64,27 +75,62 @@ def _download_prism_bil(url: str, label: str) -> Path:
     return bil_files[0]
 
 
-def _sample_raster_at_points(bil_path: Path, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
-    """Sample a PRISM BIL raster at the given lat/lon coordinates.
+def _pixel_indices(
+    transform: "Affine", shape: tuple[int, int], lats: np.ndarray, lons: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Map lat/lon points to raster (row, col) indices plus an in-bounds mask."""
+    from rasterio.transform import rowcol
+
+    rows, cols = rowcol(transform, lons, lats)
+    rows = np.asarray(rows)
+    cols = np.asarray(cols)
+    inside = (rows >= 0) & (rows < shape[0]) & (cols >= 0) & (cols < shape[1])
+    return rows, cols, inside
 
-    Returns an array of values (NaN where coordinates fall outside the raster).
+
+def _sample_rasters_at_points(
+    bil_paths: dict[str, Path], lats: np.ndarray, lons: np.ndarray
+) -> dict[str, np.ndarray]:
+    """Sample PRISM BIL rasters at the given lat/lon coordinates.
+
+    Returns one array per label (NaN where coordinates fall outside the raster).
+    All PRISM 4km normals share one grid, so pixel indices are computed once
+    and reused for every band; they are only recomputed if a raster's grid
+    differs from the previous one.
     """
     import rasterio
 
-    with rasterio.open(bil_path) as src:
-        # Convert lat/lon to raster row/col indices
+    samples: dict[str, np.ndarray] = {}
+    grid = None
+    for label, bil_path in bil_paths.items():
+        with rasterio.open(bil_path) as src:
+            if grid != (src.transform, src.shape):
+                grid = (src.transform, src.shape)
+                rows, cols, inside = _pixel_indices(src.transform, src.shape, lats, lons)
+                logger.info(
+                    f"Sampled {inside.sum()}/{len(lats)} points in-bounds for {bil_path.name}"
+                )
+            band = src.read(1)
+
         values = np.full(len(lats), np.nan)
-        for i, (lon, lat) in enumerate(zip(lons, lats, strict=True)):
-            try:
-                row, col = src.index(float(lon), float(lat))
-                if 0 <= row < src.height and 0 <= col < src.width:
-                    val = src.read(1)[row, col]
-                    # PRISM uses -9999 as nodata
-                    if val > -9999:
-                        values[i] = val
-            except Exception:
-                continue
-    return values
+        values[inside] = band[rows[inside], cols[inside]]
+        # PRISM uses -9999 as nodata
+        values[values <= -9999] = np.nan
+        samples[label] = values
+    return samples
+
+
+def _celsius_to_fahrenheit(values: np.ndarray) -> np.ndarray:
+    """Convert °C to °F rounded to 0.1, in place (the sampled arrays are scratch)."""
+    np.multiply(values, 9 / 5, out=values)
+    np.add(values, 32, out=values)
+    return np.round(values, 1, out=values)
+
+
+def _mm_to_inches(values: np.ndarray) -> np.ndarray:
+    """Convert millimetres to inches rounded to 0.01, in place."""
+    np.divide(values, 25.4, out=values)
+    return np.round(values, 2, out=values)
 
 
 def load_prism_normals(state_abbr: str) -> dict:
@@ -99,7 +145,7 @@ def load_prism_normals(state_abbr: str) -> dict:
         raise ValueError(f"Unknown state: {state_abbr}")
 
     statecd = STATE_CODES[state_abbr]
-    engine = create_engine(settings.database_url_sync)
+    engine = make_engine()
 
     try:
         # Get plot coordinates for this state
@@ -121,24 +167,35 @@ def load_prism_normals(state_abbr: str) -> dict:
         lats = plots["lat"].values
         lons = plots["lon"].values
 
-        # Download and sample each variable
+        # Download all rasters concurrently, then sample each variable
         raster_paths: dict[str, Path] = {}
         try:
-            for label, url in PRISM_VARS.items():
-                raster_paths[label] = _download_prism_bil(url, label)
+            with (
+                make_http_client() as http,
+                ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as pool,
+            ):
+                futures = {
+                    label: pool.submit(_download_prism_bil, http, url, label)
+                    for label, url in {**PRISM_VARS, **GROWING_SEASON_PPT}.items()
+                }
+            # The pool has waited for every download; keep the successful ones
+            # so the finally block cleans them up even if another one failed
+            raster_paths.update(
+                {label: f.result() for label, f in futures.items() if f.exception() is None}
+            )
+            for future in futures.values():
+                if (error := future.exception()) is not None:
+                    raise error
 
-            tmean_annual = _sample_raster_at_points(raster_paths["tmean_annual"], lats, lons)
-            ppt_annual = _sample_raster_at_points(raster_paths["ppt_annual"], lats, lons)
-            tmean_jan = _sample_raster_at_points(raster_paths["tmean_jan"], lats, lons)
-            tmean_jul = _sample_raster_at_points(raster_paths["tmean_jul"], lats, lons)
+            samples = _sample_rasters_at_points(raster_paths, lats, lons)
+            tmean_annual = samples["tmean_annual"]
+            ppt_annual = samples["ppt_annual"]
+            tmean_jan = samples["tmean_jan"]
+            tmean_jul = samples["tmean_jul"]
 
-            # Download growing season months (Apr=4 through Sep=9) for precip
             growing_ppt = np.zeros(len(plots))
-            for month in range(4, 10):
-                url = f"{PRISM_BASE}/ppt/{month}"
-                bil_path = _download_prism_bil(url, f"ppt_{month:02d}")
-                raster_paths[f"ppt_{month:02d}"] = bil_path
-                growing_ppt += _sample_raster_at_points(bil_path, lats, lons)
+            for label in GROWING_SEASON_PPT:
+                growing_ppt += samples[label]
         finally:
             # Clean up downloaded rasters
             for path in raster_paths.values():
@@ -151,11 +208,11 @@ def load_prism_normals(state_abbr: str) -> dict:
         results = pd.DataFrame(
             {
                 "plot_cn": plots["cn"],
-                "annual_tmean_f": np.round(tmean_annual * 9 / 5 + 32, 1),
-                "annual_ppt_in": np.round(ppt_annual / 25.4, 2),  # mm to inches
-                "jan_tmean_f": np.round(tmean_jan * 9 / 5 + 32, 1),
-                "jul_tmean_f": np.round(tmean_jul * 9 / 5 + 32, 1),
-                "growing_season_ppt_in": np.round(growing_ppt / 25.4, 2),
+                "annual_tmean_f": _celsius_to_fahrenheit(tmean_annual),
+                "annual_ppt_in": _mm_to_inches(ppt_annual),
+                "jan_tmean_f": _celsius_to_fahrenheit(tmean_jan),
+                "jul_tmean_f": _celsius_to_fahrenheit(tmean_jul),
+                "growing_season_ppt_in": _mm_to_inches(growing_ppt),
             }
         )
 
@@ -163,7 +220,8 @@ def load_prism_normals(state_abbr: str) -> dict:
         climate_cols = [c for c in results.columns if c != "plot_cn"]
         results = results.dropna(subset=climate_cols, how="all")
 
-        # Delete existing state data and insert
+        # Replace this state's rows in one transaction so a failed COPY
+        # leaves the previous normals in place
         with engine.begin() as conn:
             conn.execute(
                 text("""
@@ -174,16 +232,8 @@ def load_prism_normals(state_abbr: str) -> dict:
                 """),
                 {"statecd": statecd},
             )
+            _copy_dataframe(conn, "raw", "prism_normals", results)
 
-        results.to_sql(
-            "prism_normals",
-            engine,
-            schema="raw",
-            if_exists="append",
-            index=False,
-            method="multi",
-            chunksize=5000,
-        )
         logger.info(f"Loaded climate normals for {len(results)} plots in {state_abbr}")
 
     finally:
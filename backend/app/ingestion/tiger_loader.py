@@ -9,36 +9,66 @@ Usage:
 """
 
 import argparse
+import hashlib
 import logging
 import tempfile
 from pathlib import Path
 
 import geopandas as gpd
-import httpx
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 
-from app.core.config import settings
-from app.ingestion.fia_loader import STATE_CODES
+from app.ingestion.fia_loader import STATE_CODES, make_engine, make_http_client
 
 logger = logging.getLogger(__name__)
 
 TIGER_URL = "https://www2.census.gov/geo/tiger/TIGER2023/COUNTY/tl_2023_us_county.zip"
+TIGER_CACHE_DIR = Path(tempfile.gettempdir()) / "forest_explorer_tiger"
 
+# Zoom-banded simplified views over raw.county_boundaries (see scripts/init-db.sql)
+SIMPLIFIED_VIEWS = [
+    "raw.mv_county_boundaries_z4",
+    "raw.mv_county_boundaries_z7",
+    "raw.mv_county_boundaries_z10",
+]
 
-def download_shapefile(url: str) -> Path:
-    """Download a zipped shapefile to a temp directory and return the path."""
-    tmp_dir = tempfile.mkdtemp(prefix="tiger_")
-    zip_path = Path(tmp_dir) / "county.zip"
-    logger.info(f"Downloading TIGER county shapefile from {url}")
+
+def download_shapefile(url: str, cache_dir: Path = TIGER_CACHE_DIR) -> Path:
+    """Download a zipped shapefile into a local cache and return the path.
+
+    A TIGER vintage never changes, so the national zip is kept between runs
+    and revalidated with a conditional GET on its ETag — loading a second
+    state costs one 304 round trip instead of an ~80 MB download.
+    """
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    zip_path = cache_dir / f"{hashlib.sha256(url.encode()).hexdigest()[:16]}.zip"
+    etag_path = zip_path.with_suffix(".etag")
+
+    headers = {}
+    if zip_path.exists() and etag_path.exists():
+        headers["If-None-Match"] = etag_path.read_text()
 
     with (
-        httpx.Client(timeout=httpx.Timeout(30, read=300), follow_redirects=True) as client,
-        client.stream("GET", url) as resp,
+        make_http_client() as client,
+        client.stream("GET", url, headers=headers) as resp,
     ):
+        if resp.status_code == 304:
+            logger.info(f"Using cached TIGER county shapefile {zip_path}")
+            return zip_path
+
+        logger.info(f"Downloading TIGER county shapefile from {url}")
         resp.raise_for_status()
-        with open(zip_path, "wb") as f:
+        # Write beside the cache entry and swap in, so an interrupted
+        # download never leaves a truncated zip behind
+        part_path = zip_path.with_suffix(".part")
+        with open(part_path, "wb") as f:
             for chunk in resp.iter_bytes(chunk_size=1024 * 1024):
                 f.write(chunk)
+        part_path.replace(zip_path)
+
+        if etag := resp.headers.get("etag"):
+            etag_path.write_text(etag)
+        else:
+            etag_path.unlink(missing_ok=True)
 
     logger.info(f"Downloaded {zip_path.stat().st_size / 1024 / 1024:.1f} MB")
     return zip_path
@@ -57,13 +87,16 @@ def load_county_boundaries(state_abbr: str) -> dict:
     statefp = str(statecd).zfill(2)
 
     zip_path = download_shapefile(TIGER_URL)
-    try:
-        gdf = gpd.read_file(f"zip://{zip_path}")
-    finally:
-        zip_path.unlink(missing_ok=True)
+    # Push the state filter and column subset down into OGR so only this
+    # state's polygons are decoded from the national shapefile. The
+    # where-clause field must itself be among the selected columns.
+    gdf = gpd.read_file(
+        f"zip://{zip_path}",
+        engine="pyogrio",
+        where=f"STATEFP = '{statefp}'",
+        columns=["STATEFP", "COUNTYFP", "GEOID", "NAME", "ALAND", "AWATER"],
+    )
 
-    # Filter to target state
-    gdf = gdf[gdf["STATEFP"] == statefp].copy()
     logger.info(f"Found {len(gdf)} counties for {state_abbr} (STATEFP={statefp})")
 
     if len(gdf) == 0:
@@ -86,7 +119,7 @@ def load_county_boundaries(state_abbr: str) -> dict:
     if gdf.crs and gdf.crs.to_epsg() != 4326:
         gdf = gdf.to_crs(epsg=4326)
 
-    engine = create_engine(settings.database_url_sync)
+    engine = make_engine()
     try:
         # Delete existing state data
         with engine.begin() as conn:
@@ -105,6 +138,12 @@ def load_county_boundaries(state_abbr: str) -> dict:
             index=False,
         )
         logger.info(f"Loaded {len(gdf)} county boundaries for {state_abbr}")
+
+        # Rebuild simplified geometry; CONCURRENTLY keeps API reads unblocked
+        with engine.begin() as conn:
+            for view in SIMPLIFIED_VIEWS:
+                conn.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view}"))
+        logger.info(f"Refreshed {len(SIMPLIFIED_VIEWS)} simplified county views")
     finally:
         engine.dispose()
 
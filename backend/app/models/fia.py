@@ -3,7 +3,7 @@
 from datetime import datetime
 
 from geoalchemy2 import Geometry
-from sqlalchemy import BigInteger, DateTime, Double, Integer, String, func
+from sqlalchemy import BigInteger, DateTime, Double, Index, Integer, String, func, text
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -40,7 +40,10 @@ class FIACond(Base):
     """Raw FIA condition data — stand-level attributes per plot."""
 
     __tablename__ = "fia_cond"
-    __table_args__ = {"schema": "raw"}
+    __table_args__ = (
+        Index("idx_fia_cond_statecd_brin", "statecd", postgresql_using="brin"),
+        {"schema": "raw"},
+    )
 
     cn: Mapped[int] = mapped_column(BigInteger, primary_key=True)
     plt_cn: Mapped[int | None] = mapped_column(BigInteger)
@@ -67,7 +70,17 @@ class FIATree(Base):
     """Raw FIA tree measurements — individual tree carbon and biomass."""
 
     __tablename__ = "fia_tree"
-    __table_args__ = {"schema": "raw"}
+    __table_args__ = (
+        Index("idx_fia_tree_statecd_brin", "statecd", postgresql_using="brin"),
+        Index(
+            "idx_fia_tree_live_species",
+            "statecd",
+            "spcd",
+            postgresql_include=["plt_cn", "carbon_ag", "carbon_bg", "tpa_unadj", "dia"],
+            postgresql_where=text("statuscd = 1"),
+        ),
+        {"schema": "raw"},
+    )
 
     cn: Mapped[int] = mapped_column(BigInteger, primary_key=True)
     plt_cn: Mapped[int | None] = mapped_column(BigInteger)
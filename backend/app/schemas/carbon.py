@@ -1,13 +1,21 @@
 """Pydantic schemas for API responses — GeoJSON-native for spatial data."""
 
 from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class _Schema(BaseModel):
+    """Base for response schemas: immutable once built, and unknown fields are rejected."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
-from pydantic import BaseModel, Field
 
 # ── Carbon metrics ──────────────────────────────────────────────────────────
 
 
-class CarbonBySpecies(BaseModel):
+class CarbonBySpecies(_Schema):
     """Carbon density aggregated by tree species."""
 
     spcd: int
@@ -19,7 +27,7 @@ class CarbonBySpecies(BaseModel):
     avg_dia: float = Field(description="Mean diameter at breast height (inches)")
 
 
-class CarbonByCounty(BaseModel):
+class CarbonByCounty(_Schema):
     """Carbon summary by county with GeoJSON-compatible coordinates."""
 
     statecd: int
@@ -32,7 +40,7 @@ class CarbonByCounty(BaseModel):
     dominant_forest_type: str | None = None
 
 
-class CarbonSummary(BaseModel):
+class CarbonSummary(_Schema):
     """High-level carbon statistics for a state or region."""
 
     statecd: int
@@ -55,7 +63,7 @@ class CarbonSummary(BaseModel):
 # ── GeoJSON ─────────────────────────────────────────────────────────────────
 
 
-class PlotProperties(BaseModel):
+class PlotProperties(_Schema):
     """Properties embedded in a GeoJSON Feature for a plot."""
 
     cn: int
@@ -70,15 +78,15 @@ class PlotProperties(BaseModel):
     stand_age: int | None
 
 
-class GeoJSONFeature(BaseModel):
+class GeoJSONFeature(_Schema):
     """A single GeoJSON Feature."""
 
     type: str = "Feature"
-    geometry: dict
+    geometry: dict[str, Any]
     properties: PlotProperties
 
 
-class PlotFeatureCollection(BaseModel):
+class PlotFeatureCollection(_Schema):
     """GeoJSON FeatureCollection of FIA plots."""
 
     type: str = "FeatureCollection"
@@ -88,7 +96,7 @@ class PlotFeatureCollection(BaseModel):
 # ── QA/QC ───────────────────────────────────────────────────────────────────
 
 
-class QACheckResult(BaseModel):
+class QACheckResult(_Schema):
     """Result of a single QA/QC validation check."""
 
     check_name: str
@@ -97,10 +105,10 @@ class QACheckResult(BaseModel):
     records_checked: int
     records_failed: int
     failure_rate: float
-    details: dict | None = None
+    details: dict[str, Any] | None = None
 
 
-class QARunSummary(BaseModel):
+class QARunSummary(_Schema):
     """Summary of a full QA/QC validation run."""
 
     run_id: str
@@ -114,16 +122,16 @@ class QARunSummary(BaseModel):
 # ── Data Health ─────────────────────────────────────────────────────────────
 
 
-class TableHealth(BaseModel):
+class TableHealth(_Schema):
     """Health status of a single database table."""
 
     table_name: str
-    row_count: int
+    row_count: int = Field(description="Estimated row count from catalog statistics")
     status: str = Field(description="populated, empty, or missing")
     required: bool = True
 
 
-class DataHealthReport(BaseModel):
+class DataHealthReport(_Schema):
     """Overall data pipeline health report."""
 
     overall_status: str = Field(description="healthy, degraded, or empty")
@@ -137,7 +145,7 @@ class DataHealthReport(BaseModel):
 # ── Ingestion ───────────────────────────────────────────────────────────────
 
 
-class IngestionStatus(BaseModel):
+class IngestionStatus(_Schema):
     """Status response for data ingestion jobs."""
 
     state: str
@@ -4,8 +4,13 @@ These queries serve the dashboard and mirror the kind of aggregations
 a data engineer would build for team visibility.
 """
 
+import asyncio
 import logging
+import time
+from collections.abc import AsyncIterator
 
+import orjson
+from pydantic import TypeAdapter
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -14,7 +19,6 @@ from app.schemas.carbon import (
     CarbonSummary,
     GeoJSONFeature,
     PlotFeatureCollection,
-    PlotProperties,
 )
 
 logger = logging.getLogger(__name__)
@@ -42,32 +46,78 @@ _FALLBACK_SPECIES_NAMES: dict[int, str] = {
 }
 
 
+# Static statements are built once at import so SQLAlchemy's compiled cache and
+# the per-connection prepared-statement cache both see the same objects.
+# Both aggregates filter on fia_tree's own statecd, so neither needs to join
+# fia_plot; the BRIN index on fia_tree(statecd) narrows the scan to the state.
+_CARBON_SUMMARY_SQL = text("""
+    SELECT
+        t.statecd,
+        COUNT(DISTINCT t.plt_cn) AS total_plots,
+        COUNT(*) AS total_trees,
+        ROUND(COALESCE(SUM(t.carbon_ag * t.tpa_unadj) / 2000.0, 0)::numeric, 2)::float8
+            AS total_carbon_ag_tons,
+        ROUND(COALESCE(SUM(t.carbon_bg * t.tpa_unadj) / 2000.0, 0)::numeric, 2)::float8
+            AS total_carbon_bg_tons,
+        ROUND(COALESCE(
+            AVG(t.carbon_ag + COALESCE(t.carbon_bg, 0)) * AVG(t.tpa_unadj) / 2000.0, 0
+        )::numeric, 4)::float8 AS avg_carbon_per_acre_tons,
+        COUNT(DISTINCT t.spcd) AS species_count,
+        (SELECT MAX(invyr) FROM raw.fia_plot WHERE statecd = :statecd) AS most_recent_inventory,
+        ROUND(COALESCE(
+            100.0 * COUNT(*) FILTER (WHERE t.spcd = 131) / NULLIF(COUNT(*), 0), 0
+        ), 1)::float8 AS loblolly_pine_pct
+    FROM raw.fia_tree t
+    WHERE t.statecd = :statecd
+      AND t.statuscd = 1  -- live trees only
+    GROUP BY t.statecd
+""")
+
+_CARBON_BY_SPECIES_SQL = text("""
+    WITH species_agg AS (
+        SELECT
+            t.spcd,
+            COUNT(DISTINCT t.plt_cn) AS plot_count,
+            AVG(t.carbon_ag * t.tpa_unadj) AS avg_carbon_ag_per_acre,
+            AVG(COALESCE(t.carbon_bg, 0) * t.tpa_unadj) AS avg_carbon_bg_per_acre,
+            AVG((t.carbon_ag + COALESCE(t.carbon_bg, 0)) * t.tpa_unadj)
+                AS avg_carbon_total_per_acre,
+            AVG(t.dia) AS avg_dia
+        FROM raw.fia_tree t
+        WHERE t.statecd = :statecd
+          AND t.statuscd = 1
+          AND t.carbon_ag IS NOT NULL
+          AND t.tpa_unadj IS NOT NULL
+        GROUP BY t.spcd
+        HAVING COUNT(DISTINCT t.plt_cn) >= 5
+    )
+    SELECT
+        s.spcd,
+        s.plot_count,
+        ROUND(s.avg_carbon_ag_per_acre::numeric, 2)::float8 AS avg_carbon_ag_per_acre,
+        ROUND(s.avg_carbon_bg_per_acre::numeric, 2)::float8 AS avg_carbon_bg_per_acre,
+        ROUND(s.avg_carbon_total_per_acre::numeric, 2)::float8 AS avg_carbon_total_per_acre,
+        ROUND(s.avg_dia::numeric, 1)::float8 AS avg_dia
+    FROM species_agg s
+    ORDER BY s.avg_carbon_total_per_acre DESC
+    LIMIT :limit
+""")
+
+_SPECIES_NAMES_SQL = text("SELECT spcd, common_name FROM public.species_ref")
+
+_FEATURES_ADAPTER = TypeAdapter(list[GeoJSONFeature])
+
+# species_ref only changes when dbt seeds run, so one load serves every
+# request in the process for the TTL. The lock keeps a cold cache from
+# sending one query per concurrent request.
+_SPECIES_CACHE_TTL_SECONDS = 600
+_species_cache: tuple[float, dict[int, str]] | None = None
+_species_cache_lock = asyncio.Lock()
+
+
 async def get_carbon_summary(db: AsyncSession, statecd: int) -> CarbonSummary:
     """Aggregate carbon statistics for a state."""
-    result = await db.execute(
-        text("""
-            SELECT
-                p.statecd,
-                COUNT(DISTINCT p.cn) AS total_plots,
-                COUNT(t.cn) AS total_trees,
-                COALESCE(SUM(t.carbon_ag * t.tpa_unadj) / 2000.0, 0) AS total_carbon_ag_tons,
-                COALESCE(SUM(t.carbon_bg * t.tpa_unadj) / 2000.0, 0) AS total_carbon_bg_tons,
-                COALESCE(
-                    AVG(t.carbon_ag + COALESCE(t.carbon_bg, 0)) * AVG(t.tpa_unadj) / 2000.0, 0
-                ) AS avg_carbon_per_acre_tons,
-                COUNT(DISTINCT t.spcd) AS species_count,
-                MAX(p.invyr) AS most_recent_inventory,
-                COALESCE(
-                    100.0 * COUNT(*) FILTER (WHERE t.spcd = 131) / NULLIF(COUNT(*), 0), 0
-                ) AS loblolly_pine_pct
-            FROM raw.fia_plot p
-            JOIN raw.fia_tree t ON t.plt_cn = p.cn
-            WHERE p.statecd = :statecd
-              AND t.statuscd = 1  -- live trees only
-            GROUP BY p.statecd
-        """),
-        {"statecd": statecd},
-    )
+    result = await db.execute(_CARBON_SUMMARY_SQL, {"statecd": statecd})
     row = result.one_or_none()
     if row is None:
         return CarbonSummary(
@@ -86,12 +136,12 @@ async def get_carbon_summary(db: AsyncSession, statecd: int) -> CarbonSummary:
         statecd=row.statecd,
         total_plots=row.total_plots,
         total_trees=row.total_trees,
-        total_carbon_ag_tons=round(row.total_carbon_ag_tons, 2),
-        total_carbon_bg_tons=round(row.total_carbon_bg_tons, 2),
-        avg_carbon_per_acre_tons=round(row.avg_carbon_per_acre_tons, 4),
+        total_carbon_ag_tons=row.total_carbon_ag_tons,
+        total_carbon_bg_tons=row.total_carbon_bg_tons,
+        avg_carbon_per_acre_tons=row.avg_carbon_per_acre_tons,
         species_count=row.species_count,
         most_recent_inventory=row.most_recent_inventory or 0,
-        loblolly_pine_pct=round(row.loblolly_pine_pct, 1),
+        loblolly_pine_pct=row.loblolly_pine_pct,
     )
 
 
@@ -99,32 +149,7 @@ async def get_carbon_by_species(
     db: AsyncSession, statecd: int, limit: int = 20
 ) -> list[CarbonBySpecies]:
     """Top species by carbon density for a state."""
-    result = await db.execute(
-        text("""
-            WITH species_agg AS (
-                SELECT
-                    t.spcd,
-                    COUNT(DISTINCT p.cn) AS plot_count,
-                    AVG(t.carbon_ag * t.tpa_unadj) AS avg_carbon_ag_per_acre,
-                    AVG(COALESCE(t.carbon_bg, 0) * t.tpa_unadj) AS avg_carbon_bg_per_acre,
-                    AVG((t.carbon_ag + COALESCE(t.carbon_bg, 0)) * t.tpa_unadj)
-                        AS avg_carbon_total_per_acre,
-                    AVG(t.dia) AS avg_dia
-                FROM raw.fia_tree t
-                JOIN raw.fia_plot p ON p.cn = t.plt_cn
-                WHERE p.statecd = :statecd
-                  AND t.statuscd = 1
-                  AND t.carbon_ag IS NOT NULL
-                  AND t.tpa_unadj IS NOT NULL
-                GROUP BY t.spcd
-                HAVING COUNT(DISTINCT p.cn) >= 5
-            )
-            SELECT * FROM species_agg
-            ORDER BY avg_carbon_total_per_acre DESC
-            LIMIT :limit
-        """),
-        {"statecd": statecd, "limit": limit},
-    )
+    result = await db.execute(_CARBON_BY_SPECIES_SQL, {"statecd": statecd, "limit": limit})
     rows = result.all()
 
     # Species code → name mapping loaded from dbt seed (fallback to code)
@@ -135,25 +160,38 @@ async def get_carbon_by_species(
             spcd=r.spcd,
             species_name=species_names.get(r.spcd, f"SPCD {r.spcd}"),
             plot_count=r.plot_count,
-            avg_carbon_ag_per_acre=round(r.avg_carbon_ag_per_acre, 2),
-            avg_carbon_bg_per_acre=round(r.avg_carbon_bg_per_acre, 2),
-            avg_carbon_total_per_acre=round(r.avg_carbon_total_per_acre, 2),
-            avg_dia=round(r.avg_dia, 1),
+            avg_carbon_ag_per_acre=r.avg_carbon_ag_per_acre,
+            avg_carbon_bg_per_acre=r.avg_carbon_bg_per_acre,
+            avg_carbon_total_per_acre=r.avg_carbon_total_per_acre,
+            avg_dia=r.avg_dia,
         )
         for r in rows
     ]
 
 
-async def get_plots_geojson(
-    db: AsyncSession,
+def _plot_query(
     statecd: int,
-    min_carbon: float | None = None,
-    species_filter: int | None = None,
-    limit: int = 500,
-) -> PlotFeatureCollection:
-    """Return FIA plots as a GeoJSON FeatureCollection with carbon summaries."""
+    min_carbon: float | None,
+    species_filter: int | None,
+    limit: int,
+    species_names: dict[int, str],
+    bbox: tuple[float, float, float, float] | None = None,
+) -> tuple[str, dict]:
+    """Filtered, ordered plot rows shared by both plot GeoJSON builders.
+
+    Carbon totals come back rounded to 2 decimals, with zero as NULL.
+
+    The species mapping is bound as one JSON object, which works whether it
+    came from species_ref or the fallback dict. jsonb_each_text in FROM parses
+    it once per query into rows that are joined like a table, instead of
+    parsing the whole object again for every output row.
+    """
     filters = ["p.statecd = :statecd", "p.geom IS NOT NULL"]
-    params: dict = {"statecd": statecd, "limit": limit}
+    params: dict = {
+        "statecd": statecd,
+        "limit": limit,
+        "species_names": orjson.dumps(species_names, option=orjson.OPT_NON_STR_KEYS).decode(),
+    }
 
     if min_carbon is not None:
         filters.append("pc.carbon_ag_total >= :min_carbon")
@@ -163,65 +201,187 @@ async def get_plots_geojson(
         filters.append("pc.dominant_spcd = :species_filter")
         params["species_filter"] = species_filter
 
+    if bbox is not None:
+        # && is a bounding-box test the GiST index on fia_plot.geom answers directly
+        filters.append("p.geom && ST_MakeEnvelope(:minx, :miny, :maxx, :maxy, 4326)")
+        params.update(zip(("minx", "miny", "maxx", "maxy"), bbox, strict=True))
+
     where_clause = " AND ".join(filters)
+    sql = f"""
+        SELECT
+            p.cn, p.statecd, p.countycd, p.invyr, p.elev,
+            ST_X(p.geom) AS lon, ST_Y(p.geom) AS lat,
+            ROUND(NULLIF(pc.carbon_ag_total, 0)::numeric, 2)::float8 AS carbon_ag_total,
+            ROUND(NULLIF(pc.carbon_bg_total, 0)::numeric, 2)::float8 AS carbon_bg_total,
+            pc.tree_count,
+            sn.common_name AS dominant_species,
+            c.stdage
+        FROM raw.fia_plot p
+        LEFT JOIN raw.mv_plot_carbon pc ON pc.plt_cn = p.cn
+        LEFT JOIN raw.fia_cond c ON c.plt_cn = p.cn AND c.condid = 1
+        LEFT JOIN jsonb_each_text(CAST(:species_names AS TEXT)::jsonb) AS sn(spcd, common_name)
+            ON sn.spcd = pc.dominant_spcd::text
+        WHERE {where_clause}
+        ORDER BY pc.carbon_ag_total DESC NULLS LAST
+        LIMIT :limit
+    """
+    return sql, params
+
+
+async def get_plots_geojson(
+    db: AsyncSession,
+    statecd: int,
+    min_carbon: float | None = None,
+    species_filter: int | None = None,
+    limit: int = 500,
+    bbox: tuple[float, float, float, float] | None = None,
+) -> PlotFeatureCollection:
+    """Return FIA plots as a GeoJSON FeatureCollection with carbon summaries.
+
+    Per-plot carbon comes from raw.mv_plot_carbon, which fia_loader refreshes
+    after each state load, so a request never re-aggregates raw.fia_tree.
+    """
+    species_names = await _get_species_names(db)
+    sql, params = _plot_query(statecd, min_carbon, species_filter, limit, species_names, bbox)
+    result = await db.execute(text(sql), params)
+    rows = result.all()
+
+    # Plain dicts validated in one pydantic-core call, instead of two model
+    # constructors per row
+    features = _FEATURES_ADAPTER.validate_python(
+        [
+            {
+                "geometry": {"type": "Point", "coordinates": [r.lon, r.lat]},
+                "properties": {
+                    "cn": r.cn,
+                    "statecd": r.statecd,
+                    "countycd": r.countycd,
+                    "invyr": r.invyr,
+                    "elev": r.elev,
+                    "carbon_ag_total": r.carbon_ag_total,
+                    "carbon_bg_total": r.carbon_bg_total,
+                    "tree_count": r.tree_count,
+                    "dominant_species": r.dominant_species,
+                    "stand_age": r.stdage,
+                },
+            }
+            for r in rows
+        ]
+    )
 
+    return PlotFeatureCollection(features=features)
+
+
+# One GeoJSON Feature per row of _plot_query (aliased q), built by Postgres
+_PLOT_FEATURE_JSON = """
+    json_build_object(
+        'type', 'Feature',
+        'geometry', json_build_object(
+            'type', 'Point',
+            'coordinates', json_build_array(
+                round(q.lon::numeric, 6), round(q.lat::numeric, 6)
+            )
+        ),
+        'properties', json_build_object(
+            'cn', q.cn,
+            'statecd', q.statecd,
+            'countycd', q.countycd,
+            'invyr', q.invyr,
+            'elev', q.elev,
+            'carbon_ag_total', q.carbon_ag_total,
+            'carbon_bg_total', q.carbon_bg_total,
+            'tree_count', q.tree_count,
+            'dominant_species', q.dominant_species,
+            'stand_age', q.stdage
+        )
+    )
+"""
+
+
+async def get_plots_geojson_bytes(
+    db: AsyncSession,
+    statecd: int,
+    min_carbon: float | None = None,
+    species_filter: int | None = None,
+    limit: int = 500,
+    bbox: tuple[float, float, float, float] | None = None,
+) -> bytes:
+    """Same FeatureCollection as get_plots_geojson, serialized by Postgres.
+
+    json_agg builds the whole document in one scalar, so no per-row Row,
+    PlotProperties or GeoJSONFeature objects are created.
+    """
+    species_names = await _get_species_names(db)
+    sql, params = _plot_query(statecd, min_carbon, species_filter, limit, species_names, bbox)
     result = await db.execute(
         text(f"""
-            WITH plot_carbon AS (
-                SELECT
-                    plt_cn,
-                    SUM(carbon_ag * tpa_unadj) AS carbon_ag_total,
-                    SUM(COALESCE(carbon_bg, 0) * tpa_unadj) AS carbon_bg_total,
-                    COUNT(*) AS tree_count,
-                    MODE() WITHIN GROUP (ORDER BY spcd) AS dominant_spcd
-                FROM raw.fia_tree
-                WHERE statuscd = 1
-                GROUP BY plt_cn
-            )
-            SELECT
-                p.cn, p.statecd, p.countycd, p.invyr, p.elev,
-                ST_X(p.geom) AS lon, ST_Y(p.geom) AS lat,
-                pc.carbon_ag_total, pc.carbon_bg_total, pc.tree_count,
-                pc.dominant_spcd,
-                c.stdage
-            FROM raw.fia_plot p
-            LEFT JOIN plot_carbon pc ON pc.plt_cn = p.cn
-            LEFT JOIN raw.fia_cond c ON c.plt_cn = p.cn AND c.condid = 1
-            WHERE {where_clause}
-            ORDER BY pc.carbon_ag_total DESC NULLS LAST
-            LIMIT :limit
+            SELECT json_build_object(
+                'type', 'FeatureCollection',
+                'features', COALESCE(
+                    json_agg({_PLOT_FEATURE_JSON} ORDER BY q.carbon_ag_total DESC NULLS LAST),
+                    '[]'::json
+                )
+            )::text
+            FROM ({sql}) q
         """),
         params,
     )
-    rows = result.all()
+    return result.scalar_one().encode()
+
+
+async def stream_plot_features(
+    db: AsyncSession,
+    statecd: int,
+    min_carbon: float | None = None,
+    species_filter: int | None = None,
+    limit: int = 500,
+    bbox: tuple[float, float, float, float] | None = None,
+) -> AsyncIterator[bytes]:
+    """Yield the plot features one by one as RS-prefixed GeoJSON (RFC 8142).
+
+    Rows come from a server-side cursor, so memory stays flat regardless of
+    limit and the first feature can be sent before the query finishes.
+    """
     species_names = await _get_species_names(db)
+    sql, params = _plot_query(statecd, min_carbon, species_filter, limit, species_names, bbox)
+    result = await db.stream(
+        text(f"""
+            SELECT ({_PLOT_FEATURE_JSON})::text
+            FROM ({sql}) q
+            ORDER BY q.carbon_ag_total DESC NULLS LAST
+        """),
+        params,
+    )
+    async for (feature,) in result:
+        yield b"\x1e" + feature.encode() + b"\n"
 
-    features = [
-        GeoJSONFeature(
-            geometry={"type": "Point", "coordinates": [r.lon, r.lat]},
-            properties=PlotProperties(
-                cn=r.cn,
-                statecd=r.statecd,
-                countycd=r.countycd,
-                invyr=r.invyr,
-                elev=r.elev,
-                carbon_ag_total=round(r.carbon_ag_total, 2) if r.carbon_ag_total else None,
-                carbon_bg_total=round(r.carbon_bg_total, 2) if r.carbon_bg_total else None,
-                tree_count=r.tree_count,
-                dominant_species=species_names.get(r.dominant_spcd) if r.dominant_spcd else None,
-                stand_age=r.stdage,
-            ),
-        )
-        for r in rows
-    ]
 
-    return PlotFeatureCollection(features=features)
+def clear_species_cache() -> None:
+    """Drop the cached species names so the next request reloads species_ref."""
+    global _species_cache
+    _species_cache = None
 
 
 async def _get_species_names(db: AsyncSession) -> dict[int, str]:
+    """Species code → common name mapping, cached for _SPECIES_CACHE_TTL_SECONDS."""
+    global _species_cache
+    if _species_cache and time.monotonic() - _species_cache[0] < _SPECIES_CACHE_TTL_SECONDS:
+        return _species_cache[1]
+    async with _species_cache_lock:
+        # Another request may have filled the cache while we waited
+        if _species_cache and time.monotonic() - _species_cache[0] < _SPECIES_CACHE_TTL_SECONDS:
+            return _species_cache[1]
+        names = await _load_species_names(db)
+        # The fallback is not cached, so seeding species_ref takes effect at once
+        if names is not _FALLBACK_SPECIES_NAMES:
+            _species_cache = (time.monotonic(), names)
+        return names
+
+
+async def _load_species_names(db: AsyncSession) -> dict[int, str]:
     """Load species code → common name mapping from dbt seed table."""
     try:
-        result = await db.execute(text("SELECT spcd, common_name FROM public.species_ref"))
+        result = await db.execute(_SPECIES_NAMES_SQL)
         names = {r.spcd: r.common_name for r in result.all()}
         if names:
             return names
@@ -2,70 +2,52 @@
 
 Catches inconsistencies in tabular and geospatial data before they reach
 downstream dbt models — a core responsibility of a data engineering role.
-Each check is a composable function that returns a QACheckResult.
+Each check is a composable function that returns a QACheckResult; the
+runner computes all of them from one fused query.
 """
 
 import uuid
+from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime
 
+import numpy as np
+import pandas as pd
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.schemas.carbon import QACheckResult, QARunSummary
 
 
-async def check_null_coordinates(db: AsyncSession, statecd: int | None = None) -> QACheckResult:
-    """Flag plots missing lat/lon — can't build geometry without them."""
-    where = "WHERE statecd = :statecd" if statecd else ""
-    params = {"statecd": statecd} if statecd else {}
-    result = await db.execute(
-        text(f"""
-            SELECT
-                COUNT(*) AS total,
-                COUNT(*) FILTER (WHERE lat IS NULL OR lon IS NULL) AS failed
-            FROM raw.fia_plot
-            {where}
-        """),
-        params,
-    )
-    row = result.one()
-    total, failed = row.total, row.failed
-    return QACheckResult(
+def _failure_rate(failed: int, total: int) -> float:
+    return failed / total if total > 0 else 0.0
+
+
+# ── Result builders (shared by the standalone checks and the fused runner) ──
+# Every field is built here from COUNT/MIN/MAX integers and literals, so the
+# models are constructed without validation; the /qa/run response_model
+# still validates at the API boundary.
+
+
+def _null_coordinates_result(total: int, failed: int) -> QACheckResult:
+    return QACheckResult.model_construct(
         check_name="null_coordinates",
         table_name="raw.fia_plot",
         severity="error" if failed > 0 else "info",
         records_checked=total,
         records_failed=failed,
-        failure_rate=failed / total if total > 0 else 0.0,
+        failure_rate=_failure_rate(failed, total),
         details={"description": "Plots with NULL lat or lon values"},
     )
 
 
-async def check_coordinate_bounds(db: AsyncSession, statecd: int | None = None) -> QACheckResult:
-    """Validate that plot coordinates fall within continental US bounds."""
-    where = "WHERE statecd = :statecd" if statecd else ""
-    params = {"statecd": statecd} if statecd else {}
-    result = await db.execute(
-        text(f"""
-            SELECT
-                COUNT(*) AS total,
-                COUNT(*) FILTER (
-                    WHERE lat IS NOT NULL AND lon IS NOT NULL
-                    AND (lat < 24.0 OR lat > 50.0 OR lon < -125.0 OR lon > -66.0)
-                ) AS failed
-            FROM raw.fia_plot
-            {where}
-        """),
-        params,
-    )
-    row = result.one()
-    return QACheckResult(
+def _coordinate_bounds_result(total: int, failed: int) -> QACheckResult:
+    return QACheckResult.model_construct(
         check_name="coordinate_bounds_conus",
         table_name="raw.fia_plot",
-        severity="warning" if row.failed > 0 else "info",
-        records_checked=row.total,
-        records_failed=row.failed,
-        failure_rate=row.failed / row.total if row.total > 0 else 0.0,
+        severity="warning" if failed > 0 else "info",
+        records_checked=total,
+        records_failed=failed,
+        failure_rate=_failure_rate(failed, total),
         details={
             "description": "Plots outside continental US bounding box",
             "bounds": {"lat": [24.0, 50.0], "lon": [-125.0, -66.0]},
@@ -73,158 +55,241 @@ async def check_coordinate_bounds(db: AsyncSession, statecd: int | None = None)
     )
 
 
-async def check_negative_carbon(db: AsyncSession, statecd: int | None = None) -> QACheckResult:
-    """Carbon values should never be negative — flag measurement errors."""
-    join = "JOIN raw.fia_plot p ON p.cn = t.plt_cn" if statecd else ""
-    where = "WHERE p.statecd = :statecd" if statecd else ""
-    params = {"statecd": statecd} if statecd else {}
-    result = await db.execute(
-        text(f"""
-            SELECT
-                COUNT(*) AS total,
-                COUNT(*) FILTER (
-                    WHERE t.carbon_ag < 0 OR t.carbon_bg < 0
-                    OR t.drybio_ag < 0 OR t.drybio_bg < 0
-                ) AS failed
-            FROM raw.fia_tree t
-            {join}
-            {where}
-        """),
-        params,
-    )
-    row = result.one()
-    return QACheckResult(
+def _negative_carbon_result(total: int, failed: int) -> QACheckResult:
+    return QACheckResult.model_construct(
         check_name="negative_carbon_or_biomass",
         table_name="raw.fia_tree",
-        severity="error" if row.failed > 0 else "info",
-        records_checked=row.total,
-        records_failed=row.failed,
-        failure_rate=row.failed / row.total if row.total > 0 else 0.0,
+        severity="error" if failed > 0 else "info",
+        records_checked=total,
+        records_failed=failed,
+        failure_rate=_failure_rate(failed, total),
         details={"description": "Trees with negative carbon or biomass values"},
     )
 
 
-async def check_diameter_outliers(db: AsyncSession, statecd: int | None = None) -> QACheckResult:
-    """Flag trees with implausible diameters (>60 inches is extremely rare)."""
-    join = "JOIN raw.fia_plot p ON p.cn = t.plt_cn" if statecd else ""
-    where = "WHERE p.statecd = :statecd" if statecd else ""
-    params = {"statecd": statecd} if statecd else {}
-    result = await db.execute(
-        text(f"""
-            SELECT
-                COUNT(*) FILTER (WHERE t.dia IS NOT NULL) AS total,
-                COUNT(*) FILTER (WHERE t.dia > 60.0) AS failed
-            FROM raw.fia_tree t
-            {join}
-            {where}
-        """),
-        params,
-    )
-    row = result.one()
-    return QACheckResult(
+def _diameter_outliers_result(total: int, failed: int) -> QACheckResult:
+    return QACheckResult.model_construct(
         check_name="diameter_outliers",
         table_name="raw.fia_tree",
-        severity="warning" if row.failed > 0 else "info",
-        records_checked=row.total,
-        records_failed=row.failed,
-        failure_rate=row.failed / row.total if row.total > 0 else 0.0,
+        severity="warning" if failed > 0 else "info",
+        records_checked=total,
+        records_failed=failed,
+        failure_rate=_failure_rate(failed, total),
         details={"description": "Trees with DIA > 60 inches (potential measurement error)"},
     )
 
 
-async def check_orphaned_trees(db: AsyncSession, statecd: int | None = None) -> QACheckResult:
-    """Trees should reference a valid plot — orphans indicate ingestion issues."""
-    if statecd:
-        join = "JOIN raw.fia_plot p ON p.cn = t.plt_cn"
-        where = "WHERE p.statecd = :statecd"
-        subquery = "SELECT cn FROM raw.fia_plot WHERE statecd = :statecd"
-    else:
-        join = ""
-        where = ""
-        subquery = "SELECT cn FROM raw.fia_plot"
-    params = {"statecd": statecd} if statecd else {}
-    result = await db.execute(
-        text(f"""
-            SELECT
-                COUNT(*) AS total,
-                COUNT(*) FILTER (
-                    WHERE t.plt_cn NOT IN ({subquery})
-                ) AS failed
-            FROM raw.fia_tree t
-            {join}
-            {where}
-        """),
-        params,
-    )
-    row = result.one()
-    return QACheckResult(
+def _orphaned_trees_result(total: int, failed: int) -> QACheckResult:
+    return QACheckResult.model_construct(
         check_name="orphaned_trees",
         table_name="raw.fia_tree",
-        severity="error" if row.failed > 0 else "info",
-        records_checked=row.total,
-        records_failed=row.failed,
-        failure_rate=row.failed / row.total if row.total > 0 else 0.0,
+        severity="error" if failed > 0 else "info",
+        records_checked=total,
+        records_failed=failed,
+        failure_rate=_failure_rate(failed, total),
         details={"description": "Trees referencing non-existent plot CN values"},
     )
 
 
-async def check_inventory_year_range(db: AsyncSession, statecd: int | None = None) -> QACheckResult:
-    """Inventory years should be within a reasonable range."""
-    where = "WHERE statecd = :statecd" if statecd else ""
-    params = {"statecd": statecd} if statecd else {}
-    result = await db.execute(
-        text(f"""
-            SELECT
-                COUNT(*) AS total,
-                COUNT(*) FILTER (WHERE invyr < 1968 OR invyr > 2026) AS failed,
-                MIN(invyr) AS min_year,
-                MAX(invyr) AS max_year
-            FROM raw.fia_plot
-            {where}
-        """),
-        params,
-    )
-    row = result.one()
-    return QACheckResult(
+def _inventory_year_range_result(
+    total: int, failed: int, min_year: int | None, max_year: int | None
+) -> QACheckResult:
+    return QACheckResult.model_construct(
         check_name="inventory_year_range",
         table_name="raw.fia_plot",
-        severity="warning" if row.failed > 0 else "info",
-        records_checked=row.total,
-        records_failed=row.failed,
-        failure_rate=row.failed / row.total if row.total > 0 else 0.0,
+        severity="warning" if failed > 0 else "info",
+        records_checked=total,
+        records_failed=failed,
+        failure_rate=_failure_rate(failed, total),
         details={
             "description": "Plots with inventory year outside 1968-2026",
-            "min_year": row.min_year,
-            "max_year": row.max_year,
+            "min_year": min_year,
+            "max_year": max_year,
         },
     )
 
 
+# ── Checks ──────────────────────────────────────────────────────────────────
+# Statements are static: a NULL :statecd means "all states", so every call
+# reuses one cached prepared statement instead of splicing in a WHERE clause.
+
+
+_NULL_COORDINATES_SQL = text("""
+    SELECT
+        COUNT(*) AS total,
+        COUNT(*) FILTER (WHERE lat IS NULL OR lon IS NULL) AS failed
+    FROM raw.fia_plot
+    WHERE (CAST(:statecd AS INTEGER) IS NULL OR statecd = :statecd)
+""")
+
+
+async def check_null_coordinates(db: AsyncSession, statecd: int | None = None) -> QACheckResult:
+    """Flag plots missing lat/lon — can't build geometry without them."""
+    result = await db.execute(_NULL_COORDINATES_SQL, {"statecd": statecd})
+    row = result.one()
+    return _null_coordinates_result(row.total, row.failed)
+
+
+_COORDINATE_BOUNDS_SQL = text("""
+    SELECT
+        COUNT(*) AS total,
+        COUNT(*) FILTER (
+            WHERE lat IS NOT NULL AND lon IS NOT NULL
+            AND (lat < 24.0 OR lat > 50.0 OR lon < -125.0 OR lon > -66.0)
+        ) AS failed
+    FROM raw.fia_plot
+    WHERE (CAST(:statecd AS INTEGER) IS NULL OR statecd = :statecd)
+""")
+
+
+async def check_coordinate_bounds(db: AsyncSession, statecd: int | None = None) -> QACheckResult:
+    """Validate that plot coordinates fall within continental US bounds."""
+    result = await db.execute(_COORDINATE_BOUNDS_SQL, {"statecd": statecd})
+    row = result.one()
+    return _coordinate_bounds_result(row.total, row.failed)
+
+
+_NEGATIVE_CARBON_SQL = text("""
+    SELECT
+        COUNT(*) AS total,
+        COUNT(*) FILTER (
+            WHERE t.carbon_ag < 0 OR t.carbon_bg < 0
+            OR t.drybio_ag < 0 OR t.drybio_bg < 0
+        ) AS failed
+    FROM raw.fia_tree t
+    WHERE (CAST(:statecd AS INTEGER) IS NULL OR t.statecd = :statecd)
+""")
+
+
+async def check_negative_carbon(db: AsyncSession, statecd: int | None = None) -> QACheckResult:
+    """Carbon values should never be negative — flag measurement errors."""
+    result = await db.execute(_NEGATIVE_CARBON_SQL, {"statecd": statecd})
+    row = result.one()
+    return _negative_carbon_result(row.total, row.failed)
+
+
+_DIAMETER_OUTLIERS_SQL = text("""
+    SELECT
+        COUNT(*) FILTER (WHERE t.dia IS NOT NULL) AS total,
+        COUNT(*) FILTER (WHERE t.dia > 60.0) AS failed
+    FROM raw.fia_tree t
+    WHERE (CAST(:statecd AS INTEGER) IS NULL OR t.statecd = :statecd)
+""")
+
+
+async def check_diameter_outliers(db: AsyncSession, statecd: int | None = None) -> QACheckResult:
+    """Flag trees with implausible diameters (>60 inches is extremely rare)."""
+    result = await db.execute(_DIAMETER_OUTLIERS_SQL, {"statecd": statecd})
+    row = result.one()
+    return _diameter_outliers_result(row.total, row.failed)
+
+
+_ORPHANED_TREES_SQL = text("""
+    SELECT
+        COUNT(*) AS total,
+        COUNT(*) FILTER (WHERE t.plt_cn IS NOT NULL AND p.cn IS NULL) AS failed
+    FROM raw.fia_tree t
+    LEFT JOIN raw.fia_plot p ON p.cn = t.plt_cn
+    WHERE (CAST(:statecd AS INTEGER) IS NULL OR t.statecd = :statecd)
+""")
+
+
+async def check_orphaned_trees(db: AsyncSession, statecd: int | None = None) -> QACheckResult:
+    """Trees should reference a valid plot — orphans indicate ingestion issues."""
+    # Anti-join rather than NOT IN: NOT IN's NULL semantics keep Postgres from
+    # using a hashed anti-join. Filtering on the tree's own statecd (not the
+    # plot's) lets orphans in a state actually be found.
+    result = await db.execute(_ORPHANED_TREES_SQL, {"statecd": statecd})
+    row = result.one()
+    return _orphaned_trees_result(row.total, row.failed)
+
+
+_INVENTORY_YEAR_RANGE_SQL = text("""
+    SELECT
+        COUNT(*) AS total,
+        COUNT(*) FILTER (WHERE invyr < 1968 OR invyr > 2026) AS failed,
+        MIN(invyr) AS min_year,
+        MAX(invyr) AS max_year
+    FROM raw.fia_plot
+    WHERE (CAST(:statecd AS INTEGER) IS NULL OR statecd = :statecd)
+""")
+
+
+async def check_inventory_year_range(db: AsyncSession, statecd: int | None = None) -> QACheckResult:
+    """Inventory years should be within a reasonable range."""
+    result = await db.execute(_INVENTORY_YEAR_RANGE_SQL, {"statecd": statecd})
+    row = result.one()
+    return _inventory_year_range_result(row.total, row.failed, row.min_year, row.max_year)
+
+
 # ── Runner ──────────────────────────────────────────────────────────────────
 
-ALL_CHECKS = [
+ALL_CHECKS: tuple[Callable[..., Awaitable[QACheckResult]], ...] = (
     check_null_coordinates,
     check_coordinate_bounds,
     check_negative_carbon,
     check_diameter_outliers,
     check_orphaned_trees,
     check_inventory_year_range,
-]
+)
+
+
+# One statement computing every check in ALL_CHECKS. Each CTE aggregates all
+# of its table's checks with FILTER clauses, so fia_plot and fia_tree are each
+# scanned once instead of once per check.
+_FUSED_CHECKS_SQL = text("""
+    WITH plot_stats AS (
+        SELECT
+            COUNT(*) AS plots,
+            COUNT(*) FILTER (WHERE lat IS NULL OR lon IS NULL) AS null_coordinates,
+            COUNT(*) FILTER (
+                WHERE lat IS NOT NULL AND lon IS NOT NULL
+                AND (lat < 24.0 OR lat > 50.0 OR lon < -125.0 OR lon > -66.0)
+            ) AS out_of_bounds,
+            COUNT(*) FILTER (WHERE invyr < 1968 OR invyr > 2026) AS bad_invyr,
+            MIN(invyr) AS min_year,
+            MAX(invyr) AS max_year
+        FROM raw.fia_plot
+        WHERE (CAST(:statecd AS INTEGER) IS NULL OR statecd = :statecd)
+    ),
+    tree_stats AS (
+        SELECT
+            COUNT(*) AS trees,
+            COUNT(*) FILTER (
+                WHERE t.carbon_ag < 0 OR t.carbon_bg < 0
+                OR t.drybio_ag < 0 OR t.drybio_bg < 0
+            ) AS negative_carbon,
+            COUNT(*) FILTER (WHERE t.dia IS NOT NULL) AS trees_with_dia,
+            COUNT(*) FILTER (WHERE t.dia > 60.0) AS dia_outliers,
+            COUNT(*) FILTER (WHERE t.plt_cn IS NOT NULL AND p.cn IS NULL) AS orphaned
+        FROM raw.fia_tree t
+        LEFT JOIN raw.fia_plot p ON p.cn = t.plt_cn
+        WHERE (CAST(:statecd AS INTEGER) IS NULL OR t.statecd = :statecd)
+    )
+    SELECT * FROM plot_stats CROSS JOIN tree_stats
+""")
 
 
 async def run_all_checks(db: AsyncSession, statecd: int | None = None) -> QARunSummary:
-    """Execute all QA/QC checks and return a summary."""
+    """Execute all QA/QC checks in a single round trip and return a summary."""
     run_id = str(uuid.uuid4())
-    checks: list[QACheckResult] = []
+    result = await db.execute(_FUSED_CHECKS_SQL, {"statecd": statecd})
+    row = result.one()
 
-    for check_fn in ALL_CHECKS:
-        result = await check_fn(db, statecd=statecd)
-        checks.append(result)
+    # Same order as ALL_CHECKS
+    checks = [
+        _null_coordinates_result(row.plots, row.null_coordinates),
+        _coordinate_bounds_result(row.plots, row.out_of_bounds),
+        _negative_carbon_result(row.trees, row.negative_carbon),
+        _diameter_outliers_result(row.trees_with_dia, row.dia_outliers),
+        _orphaned_trees_result(row.trees, row.orphaned),
+        _inventory_year_range_result(row.plots, row.bad_invyr, row.min_year, row.max_year),
+    ]
 
     errors = sum(1 for c in checks if c.severity == "error" and c.records_failed > 0)
     warnings = sum(1 for c in checks if c.severity == "warning" and c.records_failed > 0)
 
-    return QARunSummary(
+    return QARunSummary.model_construct(
         run_id=run_id,
         timestamp=datetime.now(UTC),
         total_checks=len(checks),
@@ -232,3 +297,80 @@ async def run_all_checks(db: AsyncSession, statecd: int | None = None) -> QARunS
         warnings=warnings,
         checks=checks,
     )
+
+
+# ── Inline checks during ingest ─────────────────────────────────────────────
+# The single-table checks are vectorized over each raw CSV chunk as it is
+# loaded, so problems in the source file are reported by the ingest run
+# itself. The orphan check needs both tables and stays SQL-only.
+
+_MIN_MAX_KEYS = {"min_year": min, "max_year": max}
+
+
+def inline_chunk_counts(table_name: str, df: pd.DataFrame) -> dict[str, int]:
+    """Check counts for one raw (uppercase-column) FIA chunk of table_name.
+
+    The loader accepts CSVs without optional columns, so a check whose
+    column is missing is left out of the counts rather than failing the ingest.
+    """
+    if table_name == "fia_plot":
+        counts = {"plots": len(df)}
+        if "LAT" in df.columns and "LON" in df.columns:
+            lat = df["LAT"].to_numpy(dtype="float64", na_value=np.nan)
+            lon = df["LON"].to_numpy(dtype="float64", na_value=np.nan)
+            has_coords = ~(np.isnan(lat) | np.isnan(lon))
+            outside = (lat < 24.0) | (lat > 50.0) | (lon < -125.0) | (lon > -66.0)
+            counts["null_coordinates"] = int(np.count_nonzero(~has_coords))
+            counts["out_of_bounds"] = int(np.count_nonzero(has_coords & outside))
+        if "INVYR" in df.columns:
+            invyr = df["INVYR"].dropna()
+            counts["bad_invyr"] = int(((invyr < 1968) | (invyr > 2026)).sum())
+            if len(invyr):
+                counts["min_year"] = int(invyr.min())
+                counts["max_year"] = int(invyr.max())
+        return counts
+    if table_name == "fia_tree":
+        negative = np.zeros(len(df), dtype=bool)
+        for col in ("CARBON_AG", "CARBON_BG", "DRYBIO_AG", "DRYBIO_BG"):
+            if col in df.columns:
+                negative |= df[col].to_numpy(dtype="float64", na_value=np.nan) < 0
+        counts = {"trees": len(df), "negative_carbon": int(np.count_nonzero(negative))}
+        if "DIA" in df.columns:
+            dia = df["DIA"].to_numpy(dtype="float64", na_value=np.nan)
+            counts["trees_with_dia"] = int(np.count_nonzero(~np.isnan(dia)))
+            counts["dia_outliers"] = int(np.count_nonzero(dia > 60.0))
+        return counts
+    return {}
+
+
+def merge_inline_counts(total: dict[str, int], chunk: dict[str, int]) -> None:
+    """Fold one chunk's counts into a running total in place."""
+    for key, value in chunk.items():
+        if key in total and key in _MIN_MAX_KEYS:
+            total[key] = _MIN_MAX_KEYS[key](total[key], value)
+        else:
+            total[key] = total.get(key, 0) + value
+
+
+def inline_check_results(counts: dict[str, int]) -> list[QACheckResult]:
+    """QACheckResults for whichever tables the counts cover, in ALL_CHECKS order."""
+    checks = []
+    if "null_coordinates" in counts:
+        checks += [
+            _null_coordinates_result(counts["plots"], counts["null_coordinates"]),
+            _coordinate_bounds_result(counts["plots"], counts["out_of_bounds"]),
+        ]
+    if "trees" in counts:
+        checks.append(_negative_carbon_result(counts["trees"], counts["negative_carbon"]))
+    if "dia_outliers" in counts:
+        checks.append(_diameter_outliers_result(counts["trees_with_dia"], counts["dia_outliers"]))
+    if "bad_invyr" in counts:
+        checks.append(
+            _inventory_year_range_result(
+                counts["plots"],
+                counts["bad_invyr"],
+                counts.get("min_year"),
+                counts.get("max_year"),
+            )
+        )
+    return checks
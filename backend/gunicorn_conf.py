@@ -0,0 +1,30 @@
+"""Gunicorn settings for serving the API with multiple Uvicorn workers.
+
+Usage: gunicorn app.main:app -c gunicorn_conf.py
+
+Each worker runs its own event loop and its own SQLAlchemy pool
+(DB_POOL_SIZE + DB_MAX_OVERFLOW connections), so size WEB_CONCURRENCY against
+Postgres max_connections — or put pgbouncer in front (see README).
+"""
+
+import os
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+# Async workers each serve many requests, so one per CPU is plenty; the cap
+# keeps a container that sees all host CPUs from opening a pool per core
+workers = int(os.getenv("WEB_CONCURRENCY", min(os.process_cpu_count() or 1, 4)))
+
+# loop/http default to "auto", which picks uvloop + httptools from uvicorn[standard]
+worker_class = "uvicorn_worker.UvicornWorker"
+
+# Workers share the master's one listening socket; SO_REUSEPORT only lets a
+# new master bind the port while the old one is still shutting down
+reuse_port = True
+
+# Heartbeat files on tmpfs so a slow container disk can't stall workers
+worker_tmp_dir = "/dev/shm"
+
+# Longer than typical load balancer idle timeouts (60s) to avoid reset races
+keepalive = 65
+timeout = 120
+graceful_timeout = 30
@@ -1,10 +1,15 @@
 """Shared test fixtures."""
 
-from unittest.mock import AsyncMock, MagicMock
+from collections.abc import AsyncIterator
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
+import httpx
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.main import app
+
 
 @pytest.fixture
 def mock_db() -> AsyncMock:
@@ -12,31 +17,39 @@ def mock_db() -> AsyncMock:
     return AsyncMock(spec=AsyncSession)
 
 
-def mock_row(**kwargs: object) -> MagicMock:
-    """Create a mock result row with named attributes."""
-    row = MagicMock()
-    for k, v in kwargs.items():
-        setattr(row, k, v)
-    return row
+@pytest.fixture
+async def client() -> AsyncIterator[httpx.AsyncClient]:
+    """Async HTTP client that calls the app in-process over ASGI (no server, no lifespan)."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+def mock_row(**kwargs: object) -> SimpleNamespace:
+    """Create a result row with named attributes.
+
+    A plain namespace rather than a MagicMock: it is far cheaper to build,
+    and reading a column the test didn't set fails instead of silently
+    returning another mock.
+    """
+    return SimpleNamespace(**kwargs)
+
+
+def mock_result_one(row: SimpleNamespace) -> SimpleNamespace:
+    """Create a DB execute result that returns one row via .one() or .one_or_none()."""
+    return SimpleNamespace(one=lambda: row, one_or_none=lambda: row)
 
 
-def mock_result_one(row: MagicMock) -> MagicMock:
-    """Create a mock DB execute result that returns one row via .one() or .one_or_none()."""
-    result = MagicMock()
-    result.one.return_value = row
-    result.one_or_none.return_value = row
-    return result
+def mock_result_none() -> SimpleNamespace:
+    """Create a DB execute result where .one_or_none() returns None (empty result set)."""
+    return SimpleNamespace(one_or_none=lambda: None)
 
 
-def mock_result_none() -> MagicMock:
-    """Create a mock DB execute result where .one_or_none() returns None (empty result set)."""
-    result = MagicMock()
-    result.one_or_none.return_value = None
-    return result
+def mock_result_all(rows: list[SimpleNamespace]) -> SimpleNamespace:
+    """Create a DB execute result that returns rows via .all()."""
+    return SimpleNamespace(all=lambda: rows)
 
 
-def mock_result_all(rows: list[MagicMock]) -> MagicMock:
-    """Create a mock DB execute result that returns rows via .all()."""
-    result = MagicMock()
-    result.all.return_value = rows
-    return result
+def mock_result_scalar(value: object) -> SimpleNamespace:
+    """Create a DB execute result that returns a single value via .scalar_one()."""
+    return SimpleNamespace(scalar_one=lambda: value)
@@ -1,10 +1,27 @@
 """Tests for the carbon metrics service — mocked DB."""
 
+from collections.abc import AsyncIterator, Iterator
 from unittest.mock import AsyncMock
 
+import pytest
+
 from app.schemas.carbon import CarbonSummary, PlotFeatureCollection
 from app.services import carbon
-from tests.conftest import mock_result_all, mock_result_none, mock_result_one, mock_row
+from tests.conftest import (
+    mock_result_all,
+    mock_result_none,
+    mock_result_one,
+    mock_result_scalar,
+    mock_row,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_species_cache() -> Iterator[None]:
+    """Keep the module-level species cache from leaking between tests."""
+    carbon.clear_species_cache()
+    yield
+    carbon.clear_species_cache()
 
 
 async def test_get_carbon_summary(mock_db: AsyncMock) -> None:
@@ -70,6 +87,17 @@ async def test_get_carbon_summary_empty_data(mock_db: AsyncMock) -> None:
     assert summary.loblolly_pine_pct == 0.0
 
 
+async def test_get_species_names_cached(mock_db: AsyncMock) -> None:
+    """A successful species_ref load should be served from cache on the next call."""
+    mock_db.execute.return_value = mock_result_all([mock_row(spcd=131, common_name="loblolly")])
+
+    first = await carbon._get_species_names(mock_db)
+    second = await carbon._get_species_names(mock_db)
+
+    assert first == second == {131: "loblolly"}
+    assert mock_db.execute.await_count == 1
+
+
 async def test_get_species_names_fallback(mock_db: AsyncMock) -> None:
     """When staging table doesn't exist, _get_species_names returns hardcoded dict."""
     mock_db.execute.side_effect = Exception("relation does not exist")
@@ -97,8 +125,8 @@ async def test_get_carbon_by_species_empty(mock_db: AsyncMock) -> None:
 async def test_get_plots_geojson_empty(mock_db: AsyncMock) -> None:
     """Empty plot results should return a valid empty FeatureCollection."""
     mock_db.execute.side_effect = [
-        mock_result_all([]),  # main plots query
         Exception("relation does not exist"),  # _get_species_names fallback
+        mock_result_all([]),  # main plots query
     ]
 
     result = await carbon.get_plots_geojson(mock_db, statecd=37)
@@ -106,3 +134,45 @@ async def test_get_plots_geojson_empty(mock_db: AsyncMock) -> None:
     assert isinstance(result, PlotFeatureCollection)
     assert result.type == "FeatureCollection"
     assert result.features == []
+
+
+async def test_get_plots_geojson_bytes_passes_species_names(mock_db: AsyncMock) -> None:
+    """The Postgres-built collection is returned as bytes, with species names as a parameter."""
+    body = '{"type": "FeatureCollection", "features": []}'
+    mock_db.execute.side_effect = [
+        Exception("relation does not exist"),  # _get_species_names fallback
+        mock_result_scalar(body),
+    ]
+
+    result = await carbon.get_plots_geojson_bytes(mock_db, statecd=37)
+
+    assert result == body.encode()
+    params = mock_db.execute.await_args.args[1]
+    assert '"131":"loblolly pine"' in params["species_names"]
+
+
+def test_plot_query_bbox_filter() -> None:
+    """A bbox should add an index-friendly envelope filter with bound corners."""
+    sql, params = carbon._plot_query(37, None, None, 500, {}, bbox=(-80.0, 35.0, -79.0, 36.0))
+
+    assert "p.geom && ST_MakeEnvelope(:minx, :miny, :maxx, :maxy, 4326)" in sql
+    assert (params["minx"], params["miny"], params["maxx"], params["maxy"]) == (
+        -80.0,
+        35.0,
+        -79.0,
+        36.0,
+    )
+
+
+async def test_stream_plot_features_yields_rs_prefixed_lines(mock_db: AsyncMock) -> None:
+    """Each streamed row should become one RFC 8142 record."""
+
+    async def rows() -> AsyncIterator[tuple[str]]:
+        yield ('{"type": "Feature"}',)
+
+    mock_db.execute.side_effect = Exception("relation does not exist")  # species fallback
+    mock_db.stream.return_value = rows()
+
+    chunks = [c async for c in carbon.stream_plot_features(mock_db, statecd=37)]
+
+    assert chunks == [b'\x1e{"type": "Feature"}\n']
@@ -1,10 +1,15 @@
 """Tests for FIA ingestion — pure function tests on clean/transform logic."""
 
+from unittest.mock import MagicMock
+
 import pandas as pd
 import pytest
+import shapely
 
 from app.ingestion.fia_loader import (
     STATE_CODES,
+    _drop_secondary_indexes,
+    _to_copy_csv,
     clean_cond_df,
     clean_plot_df,
     clean_tree_df,
@@ -121,6 +126,14 @@ def test_clean_plot_df_lowercases_columns() -> None:
     assert all(c == c.lower() for c in cleaned.columns)
 
 
+def test_clean_plot_df_builds_geometry() -> None:
+    """Plots should carry an EWKB point (SRID 4326) built from lon/lat."""
+    cleaned = clean_plot_df(_make_plot_df())
+    point = shapely.from_wkb(cleaned["geom"].iloc[0])
+    assert (point.x, point.y) == (-79.0, 35.5)
+    assert shapely.get_srid(point) == 4326
+
+
 def test_clean_tree_df_preserves_rows() -> None:
     """Valid tree rows should survive cleaning."""
     df = _make_tree_df()
@@ -156,7 +169,40 @@ def test_clean_plot_df_handles_missing_optional_columns() -> None:
     assert "lat" in cleaned.columns
 
 
+def test_to_copy_csv_writes_whole_floats_as_ints() -> None:
+    """Nullable integer columns read as float64 must serialize as COPY-safe ints and NULLs."""
+    df = pd.DataFrame({"cn": [2001, 2002], "stdage": [35.0, None], "dia": [8.5, None]})
+    lines = _to_copy_csv(df).read().splitlines()
+    assert lines == ["2001,35,8.5", "2002,,"]
+
+
+def test_clean_tree_df_narrows_code_columns() -> None:
+    """Small integer codes should be downcast after cleaning."""
+    cleaned = clean_tree_df(_make_tree_df())
+    assert cleaned["statecd"].dtype == "Int8"
+    assert cleaned["spcd"].dtype == "Int16"
+
+
+def test_clean_tree_df_rejects_out_of_range_code() -> None:
+    """A code too large for its narrow dtype should raise, not wrap around."""
+    df = _make_tree_df()
+    df["CR"] = 400
+    with pytest.raises(ValueError, match="cr"):
+        clean_tree_df(df)
+
+
 def test_ingest_state_invalid_raises() -> None:
     """Unknown state abbreviation should raise ValueError."""
     with pytest.raises(ValueError, match="Unknown state"):
         ingest_state("XX")
+
+
+def test_drop_secondary_indexes_keeps_indexes_on_populated_tables() -> None:
+    """Tables already holding other states' rows must keep their indexes."""
+    engine = MagicMock()
+    conn = engine.begin.return_value.__enter__.return_value
+    conn.scalar.return_value = True  # EXISTS: every table has rows
+
+    _drop_secondary_indexes(engine, ["fia_plot", "fia_tree"])
+
+    conn.exec_driver_sql.assert_not_called()
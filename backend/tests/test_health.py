@@ -1,14 +1,11 @@
 """Tests for the health endpoint."""
 
-from fastapi.testclient import TestClient
+import httpx
 
-from app.main import app
 
-
-def test_health_returns_ok() -> None:
+async def test_health_returns_ok(client: httpx.AsyncClient) -> None:
     """Health endpoint returns status ok without any DB dependency."""
-    client = TestClient(app)
-    response = client.get("/health")
+    response = await client.get("/health")
     assert response.status_code == 200
     data = response.json()
     assert data["status"] == "ok"
@@ -2,6 +2,7 @@
 
 from unittest.mock import AsyncMock
 
+import pandas as pd
 import pytest
 
 from app.schemas.carbon import QACheckResult, QARunSummary
@@ -90,22 +91,88 @@ async def test_check_inventory_year_range_clean(mock_db: AsyncMock) -> None:
 
 
 async def test_run_all_checks_returns_summary(mock_db: AsyncMock) -> None:
-    """run_all_checks should execute all checks and return a valid summary."""
-    # Mock responses for each of the 6 checks in ALL_CHECKS order
-    mock_db.execute.side_effect = [
-        mock_result_one(mock_row(total=100, failed=0)),  # null_coordinates
-        mock_result_one(mock_row(total=100, failed=0)),  # coordinate_bounds
-        mock_result_one(mock_row(total=100, failed=0)),  # negative_carbon
-        mock_result_one(mock_row(total=100, failed=0)),  # diameter_outliers
-        mock_result_one(mock_row(total=100, failed=0)),  # orphaned_trees
-        mock_result_one(mock_row(total=100, failed=0, min_year=2000, max_year=2023)),
-    ]
+    """run_all_checks should compute every check from one fused query."""
+    mock_db.execute.return_value = mock_result_one(
+        mock_row(
+            plots=100,
+            null_coordinates=0,
+            out_of_bounds=0,
+            bad_invyr=0,
+            min_year=2000,
+            max_year=2023,
+            trees=500,
+            negative_carbon=0,
+            trees_with_dia=490,
+            dia_outliers=0,
+            orphaned=0,
+        )
+    )
 
     summary = await qa_engine.run_all_checks(mock_db)
 
+    n_checks = len(qa_engine.ALL_CHECKS)
     assert isinstance(summary, QARunSummary)
-    assert summary.total_checks == len(qa_engine.ALL_CHECKS)
-    assert len(summary.checks) == len(qa_engine.ALL_CHECKS)
+    assert mock_db.execute.await_count == 1
+    assert summary.total_checks == n_checks
+    assert len(summary.checks) == n_checks
     assert summary.run_id  # non-empty UUID string
     assert summary.errors == 0
     assert summary.warnings == 0
+
+
+async def test_run_all_checks_counts_failures(mock_db: AsyncMock) -> None:
+    """Fused results should map onto the same severities as the standalone checks."""
+    mock_db.execute.return_value = mock_result_one(
+        mock_row(
+            plots=100,
+            null_coordinates=2,
+            out_of_bounds=1,
+            bad_invyr=0,
+            min_year=2000,
+            max_year=2023,
+            trees=500,
+            negative_carbon=0,
+            trees_with_dia=490,
+            dia_outliers=4,
+            orphaned=0,
+        )
+    )
+
+    summary = await qa_engine.run_all_checks(mock_db, statecd=37)
+
+    by_name = {c.check_name: c for c in summary.checks}
+    assert by_name["null_coordinates"].severity == "error"
+    assert by_name["diameter_outliers"].records_checked == 490
+    assert summary.errors == 1
+    assert summary.warnings == 2
+
+
+def test_inline_counts_merge_across_chunks() -> None:
+    """Chunk counts should sum, track the year range, and map onto the same checks."""
+    totals: dict[str, int] = {}
+    chunks = [
+        pd.DataFrame({"LAT": [35.5, None], "LON": [-80.0, -81.0], "INVYR": [2010, 2015]}),
+        pd.DataFrame({"LAT": [60.0], "LON": [-80.0], "INVYR": [2003]}),
+    ]
+    for chunk in chunks:
+        qa_engine.merge_inline_counts(totals, qa_engine.inline_chunk_counts("fia_plot", chunk))
+
+    assert totals["plots"] == 3
+    assert (totals["min_year"], totals["max_year"]) == (2003, 2015)
+
+    by_name = {c.check_name: c for c in qa_engine.inline_check_results(totals)}
+    assert set(by_name) == {"null_coordinates", "coordinate_bounds_conus", "inventory_year_range"}
+    assert by_name["null_coordinates"].records_failed == 1
+    assert by_name["coordinate_bounds_conus"].records_failed == 1
+
+
+def test_inline_counts_skip_missing_columns() -> None:
+    """A tree chunk without DIA should still be counted, minus the diameter check."""
+    chunk = pd.DataFrame({"CARBON_AG": [12.0, -1.0], "STATUSCD": [1, 1]})
+
+    counts = qa_engine.inline_chunk_counts("fia_tree", chunk)
+
+    assert counts == {"trees": 2, "negative_carbon": 1}
+    by_name = {c.check_name: c for c in qa_engine.inline_check_results(counts)}
+    assert set(by_name) == {"negative_carbon_or_biomass"}
+    assert by_name["negative_carbon_or_biomass"].records_failed == 1
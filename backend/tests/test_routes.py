@@ -0,0 +1,112 @@
+"""Tests for route-level behavior: caching and data health."""
+
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from app.api import routes
+from app.core.database import get_db_ro
+from app.main import app
+from tests.conftest import mock_result_all, mock_row
+
+# Each test runs on a fresh event loop; the route caches notice and reset,
+# which is exactly what these tests want
+pytestmark = pytest.mark.filterwarnings("ignore::async_lru.AlruCacheLoopResetWarning")
+
+
+@pytest.fixture
+def ro_db(mock_db: AsyncMock) -> Iterator[AsyncMock]:
+    """Serve get_db_ro from the mock session for the duration of a test."""
+    app.dependency_overrides[get_db_ro] = lambda: mock_db
+    yield mock_db
+    app.dependency_overrides.pop(get_db_ro)
+
+
+@pytest.fixture
+def run_all_checks(mock_db: AsyncMock, monkeypatch: pytest.MonkeyPatch) -> Iterator[AsyncMock]:
+    """Count QA runs behind a fresh _qa_summary cache, on a mock read-only session."""
+
+    @asynccontextmanager
+    async def session_ro() -> AsyncIterator[AsyncMock]:
+        yield mock_db
+
+    monkeypatch.setattr(routes, "async_session_ro", session_ro)
+    run = AsyncMock(return_value=MagicMock(name="summary"))
+    monkeypatch.setattr(routes.qa_engine, "run_all_checks", run)
+    routes._qa_summary.cache_clear()
+    yield run
+    routes._qa_summary.cache_clear()
+
+
+def _fake_ingest(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        "app.ingestion.fia_loader.ingest_state",
+        lambda state_abbr: {"state": state_abbr, "tables": {"PLOT": {"rows": 10}}},
+    )
+
+
+async def test_ingest_clears_climate_payload_cache(
+    client: httpx.AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A completed ingest changes fia_plot and mv_plot_carbon, so /climate must not serve stale."""
+    _fake_ingest(monkeypatch)
+    climate_payload = MagicMock()
+    monkeypatch.setattr(routes, "_climate_payload", climate_payload)
+
+    response = await client.post("/api/v1/ingest/NC")
+
+    assert response.json()["status"] == "completed"
+    climate_payload.cache_clear.assert_called_once()
+
+
+async def test_data_health_status_uses_exact_emptiness(
+    client: httpx.AsyncClient, ro_db: AsyncMock
+) -> None:
+    """A stale catalog estimate must not report an emptied table as populated."""
+    ro_db.execute.return_value = mock_result_all(
+        [
+            mock_row(
+                table_name=f"{schema}.{table}",
+                required=required,
+                present=True,
+                row_count=5000,
+                has_rows=table != "fia_tree",
+                dbt_models_built=True,
+                states_with_data=[37],
+            )
+            for schema, table, required in routes._HEALTH_TABLES
+        ]
+    )
+
+    response = await client.get("/api/v1/health/data")
+
+    data = response.json()
+    by_name = {t["table_name"]: t for t in data["tables"]}
+    assert by_name["raw.fia_tree"]["status"] == "empty"
+    assert by_name["raw.fia_tree"]["row_count"] == 5000
+    assert data["overall_status"] == "degraded"
+
+
+async def test_qa_summary_reused_within_ttl(run_all_checks: AsyncMock) -> None:
+    """A repeat QA run for the same state inside the TTL must not re-run the query."""
+    first = await routes._qa_summary(37)
+    second = await routes._qa_summary(37)
+
+    assert second is first
+    assert run_all_checks.await_count == 1
+
+
+async def test_ingest_clears_qa_summary_cache(
+    client: httpx.AsyncClient, run_all_checks: AsyncMock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """New data must be checked at once, not after the TTL."""
+    _fake_ingest(monkeypatch)
+    await routes._qa_summary(37)
+
+    await client.post("/api/v1/ingest/NC")
+    await routes._qa_summary(37)
+
+    assert run_all_checks.await_count == 2
@@ -5,205 +5,271 @@ real data, empty data, fallback data, or errors.
 
 Usage:
     python scripts/audit_endpoints.py [--base-url http://localhost:8002] [--state 37]
+    python scripts/audit_endpoints.py --states 37,45,13   # several states, one run
 """
 
 from __future__ import annotations
 
 import argparse
+import asyncio
+import random
 import sys
+from collections.abc import Awaitable, Callable, Collection, Sequence
+from dataclasses import dataclass
 
 import httpx
+import numpy as np
+import orjson
+
+try:  # installed with uvicorn[standard] everywhere but Windows
+    from uvloop import new_event_loop
+except ImportError:
+    new_event_loop = None
 
 # The 17 species codes from the hardcoded fallback dict in carbon.py.
 # If species results ONLY contain these, the seed table isn't being used.
-_FALLBACK_SPCD = {
-    110,
-    121,
-    129,
-    131,
-    132,
-    261,
-    316,
-    318,
-    531,
-    541,
-    621,
-    693,
-    746,
-    802,
-    833,
-    837,
-    951,
-}
+_FALLBACK_SPCD = frozenset(
+    {
+        110,
+        121,
+        129,
+        131,
+        132,
+        261,
+        316,
+        318,
+        531,
+        541,
+        621,
+        693,
+        746,
+        802,
+        833,
+        837,
+        951,
+    }
+)
 
 PASS = "\033[92m[PASS]\033[0m"
 WARN = "\033[93m[WARN]\033[0m"
 FAIL = "\033[91m[FAIL]\033[0m"
 
-
-def check_health(client: httpx.Client, base: str) -> bool:
+# Each check returns (ok, report line) rather than printing, so the checks can
+# run concurrently and still report in a fixed order.
+
+
+async def _request_with_retry(
+    client: httpx.AsyncClient,
+    method: str,
+    url: str,
+    retries: int = 3,
+    backoff: float = 0.2,
+) -> httpx.Response:
+    """Send a request, retrying transport errors and 5xx with exponential backoff.
+
+    Only GETs are retried: a repeated POST could repeat its side effects. The
+    last attempt's response (or exception) is returned as-is, so a persistent
+    failure still surfaces as FAIL.
+    """
+    if method != "GET":
+        retries = 1
+    for attempt in range(retries - 1):
+        try:
+            r = await client.request(method, url)
+            if r.status_code < 500:
+                return r
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(backoff * 2**attempt + random.random() * 0.05)
+    return await client.request(method, url)
+
+
+async def check_health(client: httpx.AsyncClient, base: str) -> tuple[bool, str]:
     """Check basic API health."""
     try:
-        r = client.get(f"{base}/health")
+        r = await _request_with_retry(client, "GET", f"{base}/health")
         if r.status_code == 200:
-            print(f"  {PASS} /health                       status=ok")
-            return True
+            return True, f"  {PASS} /health                       status=ok"
     except Exception:
         pass
     # FastAPI may not have a /health — try docs endpoint
     try:
-        r = client.get(f"{base.rsplit('/api/v1', 1)[0]}/docs")
+        r = await _request_with_retry(
+            client, "GET", f"{base.rsplit('/api/v1', 1)[0]}/docs"
+        )
         if r.status_code == 200:
-            print(f"  {PASS} /docs                         FastAPI docs reachable")
-            return True
+            return (
+                True,
+                f"  {PASS} /docs                         FastAPI docs reachable",
+            )
     except Exception:
         pass
-    print(f"  {FAIL} /health                       API not reachable")
-    return False
+    return False, f"  {FAIL} /health                       API not reachable"
 
 
-def check_summary(client: httpx.Client, base: str, state: int) -> bool:
+async def check_summary(
+    client: httpx.AsyncClient, base: str, state: int
+) -> tuple[bool, str]:
     """Check carbon summary endpoint."""
-    r = client.get(f"{base}/carbon/summary/{state}")
+    r = await _request_with_retry(client, "GET", f"{base}/carbon/summary/{state}")
     if r.status_code != 200:
-        print(f"  {FAIL} /carbon/summary/{state}          HTTP {r.status_code}")
-        return False
-    data = r.json()
+        return False, f"  {FAIL} /carbon/summary/{state}          HTTP {r.status_code}"
+    data = orjson.loads(r.content)
     plots = data.get("total_plots", 0)
     trees = data.get("total_trees", 0)
     available = data.get("data_available", True)
     if not available or plots == 0:
-        print(
+        return False, (
             f"  {FAIL} /carbon/summary/{state}          No data (plots=0, data_available={available})"
         )
-        return False
     carbon = data.get("avg_carbon_per_acre_tons", 0)
-    print(
+    return True, (
         f"  {PASS} /carbon/summary/{state}          plots={plots:,}  trees={trees:,}  carbon={carbon:.4f} t/ac"
     )
-    return True
 
 
-def check_species(client: httpx.Client, base: str, state: int) -> bool:
+async def check_species(
+    client: httpx.AsyncClient, base: str, state: int
+) -> tuple[bool, str]:
     """Check species endpoint and detect hardcoded fallback usage."""
-    r = client.get(f"{base}/carbon/species/{state}?limit=15")
+    r = await _request_with_retry(
+        client, "GET", f"{base}/carbon/species/{state}?limit=15"
+    )
     if r.status_code != 200:
-        print(f"  {FAIL} /carbon/species/{state}          HTTP {r.status_code}")
-        return False
-    data = r.json()
+        return False, f"  {FAIL} /carbon/species/{state}          HTTP {r.status_code}"
+    data = orjson.loads(r.content)
     if not data:
-        print(f"  {FAIL} /carbon/species/{state}          Empty response")
-        return False
-    # Check if all returned species codes are in the fallback set
-    returned_spcd = {s["spcd"] for s in data}
+        return False, f"  {FAIL} /carbon/species/{state}          Empty response"
     names_with_code = [s for s in data if s["species_name"].startswith("SPCD ")]
     if names_with_code:
-        print(
+        return True, (
             f"  {WARN} /carbon/species/{state}          "
             f"{len(names_with_code)} species using code fallback (seed table incomplete)"
         )
-        return True
     # If all species are in the fallback set, likely using hardcoded names
-    if returned_spcd.issubset(_FALLBACK_SPCD) and len(data) > 5:
-        print(
+    if len(data) > 5 and all(s["spcd"] in _FALLBACK_SPCD for s in data):
+        return True, (
             f"  {WARN} /carbon/species/{state}          "
             f"{len(data)} species — all from fallback set (dbt seed may not be loaded)"
         )
-        return True
-    print(
+    return True, (
         f"  {PASS} /carbon/species/{state}          {len(data)} species from seed table"
     )
-    return True
 
 
-def check_plots(client: httpx.Client, base: str, state: int) -> bool:
-    """Check GeoJSON plots endpoint."""
-    r = client.get(f"{base}/plots/{state}/geojson?limit=100")
+async def check_plots_geojson(
+    client: httpx.AsyncClient, base: str, state: int
+) -> tuple[bool, str]:
+    """Check the GeoJSON plots endpoint the frontend uses (status and feature count)."""
+    r = await _request_with_retry(
+        client, "GET", f"{base}/plots/{state}/geojson?limit=100"
+    )
     if r.status_code != 200:
-        print(f"  {FAIL} /plots/{state}/geojson           HTTP {r.status_code}")
-        return False
-    data = r.json()
-    features = data.get("features", [])
+        return False, f"  {FAIL} /plots/{state}/geojson           HTTP {r.status_code}"
+    features = orjson.loads(r.content).get("features", [])
     if not features:
-        print(f"  {FAIL} /plots/{state}/geojson           No features returned")
-        return False
-    # Validate coordinate ranges
-    bad_coords = 0
-    for f in features:
-        coords = f.get("geometry", {}).get("coordinates", [])
-        if len(coords) >= 2:
-            lon, lat = coords[0], coords[1]
-            if not (24.0 <= lat <= 50.0 and -125.0 <= lon <= -66.0):
-                bad_coords += 1
+        return False, f"  {FAIL} /plots/{state}/geojson           No features returned"
+    return True, f"  {PASS} /plots/{state}/geojson           {len(features)} features"
+
+
+async def check_plots(
+    client: httpx.AsyncClient, base: str, state: int
+) -> tuple[bool, str]:
+    """Check the plots feature stream.
+
+    Reads the GeoJSON text sequence one feature at a time and keeps only each
+    point's lon/lat, so memory doesn't grow with a whole parsed collection.
+    """
+    points: list[list[float]] = []
+    async with client.stream("GET", f"{base}/plots/{state}/geojsonseq?limit=100") as r:
+        if r.status_code != 200:
+            return (
+                False,
+                f"  {FAIL} /plots/{state}/geojsonseq        HTTP {r.status_code}",
+            )
+        n_features = 0
+        async for line in r.aiter_lines():
+            line = line.lstrip("\x1e")
+            if not line:
+                continue
+            n_features += 1
+            coords = orjson.loads(line).get("geometry", {}).get("coordinates", [])
+            if len(coords) >= 2:
+                points.append(coords[:2])
+    if not n_features:
+        return False, f"  {FAIL} /plots/{state}/geojsonseq        No features returned"
+    # Validate coordinate ranges in one vectorized pass
+    coords = np.array(points, dtype=np.float64).reshape(-1, 2)
+    lon, lat = coords[:, 0], coords[:, 1]
+    bad_coords = int(
+        np.count_nonzero((lat < 24.0) | (lat > 50.0) | (lon < -125.0) | (lon > -66.0))
+    )
     suffix = ""
     if bad_coords:
         suffix = f"  ({bad_coords} out-of-bounds coords)"
-    print(
-        f"  {PASS} /plots/{state}/geojson           {len(features)} features, coords valid{suffix}"
+    return True, (
+        f"  {PASS} /plots/{state}/geojsonseq        {n_features} features, coords valid{suffix}"
     )
-    return True
 
 
-def check_counties(client: httpx.Client, base: str, state: int) -> bool:
+async def check_counties(
+    client: httpx.AsyncClient, base: str, state: int
+) -> tuple[bool, str]:
     """Check county boundaries endpoint."""
-    r = client.get(f"{base}/counties/{state}/geojson")
+    r = await _request_with_retry(client, "GET", f"{base}/counties/{state}/geojson")
     if r.status_code == 404:
-        detail = r.json().get("detail", "not loaded")
-        print(f"  {WARN} /counties/{state}/geojson        {detail}")
-        return True
+        detail = orjson.loads(r.content).get("detail", "not loaded")
+        return True, f"  {WARN} /counties/{state}/geojson        {detail}"
     if r.status_code != 200:
-        print(f"  {FAIL} /counties/{state}/geojson        HTTP {r.status_code}")
-        return False
-    data = r.json()
+        return False, f"  {FAIL} /counties/{state}/geojson        HTTP {r.status_code}"
+    data = orjson.loads(r.content)
     features = data.get("features", [])
     if not features:
-        print(
+        return True, (
             f"  {WARN} /counties/{state}/geojson        Empty FeatureCollection for this state"
         )
-        return True
-    print(f"  {PASS} /counties/{state}/geojson        {len(features)} counties")
-    return True
+    return True, f"  {PASS} /counties/{state}/geojson        {len(features)} counties"
 
 
-def check_climate(client: httpx.Client, base: str, state: int) -> bool:
+async def check_climate(
+    client: httpx.AsyncClient, base: str, state: int
+) -> tuple[bool, str]:
     """Check climate data endpoint."""
-    r = client.get(f"{base}/climate/{state}")
+    r = await _request_with_retry(client, "GET", f"{base}/climate/{state}")
     if r.status_code == 404:
-        detail = r.json().get("detail", "not loaded")
-        print(f"  {WARN} /climate/{state}                 {detail}")
-        return True
+        detail = orjson.loads(r.content).get("detail", "not loaded")
+        return True, f"  {WARN} /climate/{state}                 {detail}"
     if r.status_code != 200:
-        print(f"  {FAIL} /climate/{state}                 HTTP {r.status_code}")
-        return False
-    data = r.json()
+        return False, f"  {FAIL} /climate/{state}                 HTTP {r.status_code}"
+    data = orjson.loads(r.content)
     if not data:
-        print(f"  {WARN} /climate/{state}                 Empty response")
-        return True
+        return True, f"  {WARN} /climate/{state}                 Empty response"
     null_climate = sum(1 for row in data if row.get("annual_tmean_f") is None)
     if null_climate > 0:
-        print(
+        return True, (
             f"  {WARN} /climate/{state}                 {null_climate}/{len(data)} rows with NULL climate columns"
         )
-        return True
-    print(
+    return True, (
         f"  {PASS} /climate/{state}                 {len(data)} records with climate data"
     )
-    return True
 
 
-def check_qa(client: httpx.Client, base: str, state: int) -> bool:
-    """Check QA engine endpoint."""
-    r = client.post(f"{base}/qa/run?statecd={state}")
+async def check_qa(
+    client: httpx.AsyncClient, base: str, state: int
+) -> tuple[bool, str]:
+    """Check QA engine endpoint.
+
+    Sent once, never retried: each run writes a batch of qa.validation_results.
+    """
+    r = await client.post(f"{base}/qa/run?statecd={state}")
     if r.status_code != 200:
-        print(f"  {FAIL} /qa/run                       HTTP {r.status_code}")
-        return False
-    data = r.json()
+        return False, f"  {FAIL} /qa/run                       HTTP {r.status_code}"
+    data = orjson.loads(r.content)
     total = data.get("total_checks", 0)
     errors = data.get("errors", 0)
     warnings = data.get("warnings", 0)
     if total == 0:
-        print(f"  {FAIL} /qa/run                       No checks executed")
-        return False
+        return False, f"  {FAIL} /qa/run                       No checks executed"
     empty_checks = sum(
         1 for c in data.get("checks", []) if c.get("records_checked", 0) == 0
     )
@@ -211,19 +277,17 @@ def check_qa(client: httpx.Client, base: str, state: int) -> bool:
     suffix = ""
     if empty_checks:
         suffix = f"  ({empty_checks} checks had 0 records)"
-    print(
+    return errors == 0, (
         f"  {status} /qa/run                       {total} checks, {errors} errors, {warnings} warnings{suffix}"
     )
-    return errors == 0
 
 
-def check_data_health(client: httpx.Client, base: str) -> bool:
+async def check_data_health(client: httpx.AsyncClient, base: str) -> tuple[bool, str]:
     """Check the data health endpoint."""
-    r = client.get(f"{base}/health/data")
+    r = await _request_with_retry(client, "GET", f"{base}/health/data")
     if r.status_code != 200:
-        print(f"  {FAIL} /health/data                  HTTP {r.status_code}")
-        return False
-    data = r.json()
+        return False, f"  {FAIL} /health/data                  HTTP {r.status_code}"
+    data = orjson.loads(r.content)
     overall = data.get("overall_status", "unknown")
     states = data.get("states_with_data", [])
     seed = data.get("dbt_seed_loaded", False)
@@ -238,8 +302,129 @@ def check_data_health(client: httpx.Client, base: str) -> bool:
         parts.append("dbt models NOT built")
 
     status = PASS if overall == "healthy" else WARN if overall == "degraded" else FAIL
-    print(f"  {status} /health/data                  {', '.join(parts)}")
-    return overall != "empty"
+    return (
+        overall != "empty",
+        f"  {status} /health/data                  {', '.join(parts)}",
+    )
+
+
+@dataclass(frozen=True)
+class Check:
+    """One audited endpoint: its path (also the --only key) and the check to run.
+
+    run takes (client, base, state), or just (client, base) for checks that
+    are not per_state; those run once per audit however many states it covers.
+    """
+
+    path: str
+    run: Callable[..., Awaitable[tuple[bool, str]]]
+    per_state: bool = True
+
+
+# Everything audited after the /health gate, in report order
+CHECKS: tuple[Check, ...] = (
+    Check("/health/data", check_data_health, per_state=False),
+    Check("/carbon/summary/{state}", check_summary),
+    Check("/carbon/species/{state}", check_species),
+    Check("/plots/{state}/geojson", check_plots_geojson),
+    Check("/plots/{state}/geojsonseq", check_plots),
+    Check("/counties/{state}/geojson", check_counties),
+    Check("/climate/{state}", check_climate),
+    Check("/qa/run", check_qa),
+)
+
+
+def make_audit_client() -> httpx.AsyncClient:
+    """Async client for the audit checks.
+
+    A single audit run uses one client. Callers that re-run the audit (a loop,
+    a scheduled probe) should create one and pass it to run_audit so the
+    connection pool survives between runs. Over HTTPS, HTTP/2 multiplexes every
+    check on one connection. Plain-http servers are reached over pooled
+    keep-alive HTTP/1.1.
+    """
+    return httpx.AsyncClient(
+        timeout=30.0,
+        http2=True,
+        limits=httpx.Limits(
+            max_keepalive_connections=8, max_connections=16, keepalive_expiry=30.0
+        ),
+    )
+
+
+async def _bounded(
+    sem: asyncio.Semaphore, check: Awaitable[tuple[bool, str]]
+) -> tuple[bool, str]:
+    """Run a check once a concurrency slot is free; retries keep the slot."""
+    async with sem:
+        return await check
+
+
+def _report(results: Sequence[tuple[bool, str] | BaseException]) -> bool:
+    """Print gathered check results in order; True if any failed."""
+    has_failure = False
+    for result in results:
+        if isinstance(result, BaseException):
+            print(f"  {FAIL} {type(result).__name__}: {result}")
+            has_failure = True
+            continue
+        ok, line = result
+        print(line)
+        has_failure = has_failure or not ok
+    return has_failure
+
+
+async def run_audit(
+    base: str,
+    states: Sequence[int],
+    client: httpx.AsyncClient | None = None,
+    max_concurrency: int = 6,
+    only: Collection[str] | None = None,
+) -> bool:
+    """Run the checks against the API and print their reports; True if any failed.
+
+    Every state is audited concurrently over the one client; reports are
+    printed afterwards, one section per state in the order given. only
+    restricts the run to the CHECKS with those paths. At most max_concurrency
+    checks are in flight at once across all states, which also bounds
+    requests on a single multiplexed HTTP/2 connection.
+    """
+    if client is None:
+        async with make_audit_client() as owned:
+            return await run_audit(base, states, owned, max_concurrency, only)
+
+    ok, line = await check_health(client, base)
+    print(line)
+    if not ok:
+        print("\n  API not reachable — aborting audit.\n")
+        sys.exit(1)
+
+    sem = asyncio.Semaphore(max_concurrency)
+    checks = [c for c in CHECKS if not only or c.path in only]
+    shared = asyncio.gather(
+        *(_bounded(sem, c.run(client, base)) for c in checks if not c.per_state),
+        return_exceptions=True,
+    )
+    by_state = [
+        asyncio.gather(
+            *(_bounded(sem, c.run(client, base, s)) for c in checks if c.per_state),
+            return_exceptions=True,
+        )
+        for s in states
+    ]
+    shared_results, *state_results = await asyncio.gather(shared, *by_state)
+
+    has_failure = _report(shared_results)
+    for state, results in zip(states, state_results, strict=True):
+        if len(states) > 1:
+            print(f"\n  State FIPS {state}")
+        has_failure = _report(results) or has_failure
+    return has_failure
+
+
+def _fips_list(value: str) -> list[int]:
+    """Parse a comma-separated list of state FIPS codes."""
+    return [int(code) for code in value.split(",") if code.strip()]
 
 
 def main() -> None:
@@ -248,34 +433,40 @@ def main() -> None:
         "--base-url", default="http://localhost:8002", help="API base URL"
     )
     parser.add_argument(
-        "--state", type=int, default=37, help="State FIPS code (default: 37=NC)"
+        "--state",
+        "--states",
+        dest="states",
+        type=_fips_list,
+        action="extend",
+        help="State FIPS code(s), comma-separated or repeated (default: 37=NC)",
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=6,
+        help="Max checks in flight at once (default: 6)",
+    )
+    parser.add_argument(
+        "--only",
+        action="append",
+        choices=[c.path for c in CHECKS],
+        metavar="PATH",
+        help="Only run the check for this endpoint path (repeatable)",
     )
     args = parser.parse_args()
+    states = list(dict.fromkeys(args.states or [37]))
 
     base = f"{args.base_url.rstrip('/')}/api/v1"
 
     print(f"\n{'=' * 55}")
     print("  Forest Carbon Data Integrity Audit")
-    print(f"  State: FIPS {args.state} | Base URL: {args.base_url}")
+    print(f"  State: FIPS {', '.join(map(str, states))} | Base URL: {args.base_url}")
     print(f"{'=' * 55}\n")
 
-    has_failure = False
-    with httpx.Client(timeout=30.0) as client:
-        if not check_health(client, base):
-            print("\n  API not reachable — aborting audit.\n")
-            sys.exit(1)
-
-        checks = [
-            check_data_health(client, base),
-            check_summary(client, base, args.state),
-            check_species(client, base, args.state),
-            check_plots(client, base, args.state),
-            check_counties(client, base, args.state),
-            check_climate(client, base, args.state),
-            check_qa(client, base, args.state),
-        ]
-        has_failure = not all(checks)
-
+    has_failure = asyncio.run(
+        run_audit(base, states, max_concurrency=args.max_concurrency, only=args.only),
+        loop_factory=new_event_loop,
+    )
     print(f"\n{'=' * 55}")
     if has_failure:
         print("  Result: ISSUES FOUND (see FAIL items above)")
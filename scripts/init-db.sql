@@ -49,6 +49,9 @@ CREATE TABLE raw.fia_cond (
 
 CREATE INDEX idx_fia_cond_plt ON raw.fia_cond (plt_cn);
 CREATE INDEX idx_fia_cond_fortyp ON raw.fia_cond (fortypcd);
+-- Rows arrive in per-state batches, so a tiny BRIN index narrows the
+-- delete-by-statecd on re-ingest to the block ranges that state occupies
+CREATE INDEX idx_fia_cond_statecd_brin ON raw.fia_cond USING BRIN (statecd);
 
 CREATE TABLE raw.fia_tree (
     cn BIGINT PRIMARY KEY,
@@ -75,6 +78,20 @@ CREATE TABLE raw.fia_tree (
 CREATE INDEX idx_fia_tree_plt ON raw.fia_tree (plt_cn);
 CREATE INDEX idx_fia_tree_spcd ON raw.fia_tree (spcd);
 CREATE INDEX idx_fia_tree_dia ON raw.fia_tree (dia);
+CREATE INDEX idx_fia_tree_statecd_brin ON raw.fia_tree USING BRIN (statecd);
+-- Live-tree aggregates per state (carbon summary, carbon by species) read
+-- only this index: partial on statuscd = 1, keyed for GROUP BY spcd
+CREATE INDEX idx_fia_tree_live_species ON raw.fia_tree (statecd, spcd)
+    INCLUDE (plt_cn, carbon_ag, carbon_bg, tpa_unadj, dia)
+    WHERE statuscd = 1;
+
+-- Indexes fia_loader dropped for a first bulk load, kept until rebuilt so a
+-- crashed load can't lose them (the loader also creates this if missing)
+CREATE TABLE IF NOT EXISTS raw.pending_index_builds (
+    definition TEXT NOT NULL
+);
+
+-- raw.mv_plot_carbon is defined in mv_plot_carbon.sql (run after this file)
 
 -- Census TIGER county boundaries
 CREATE TABLE IF NOT EXISTS raw.county_boundaries (
@@ -88,9 +105,42 @@ CREATE TABLE IF NOT EXISTS raw.county_boundaries (
     ingested_at TIMESTAMPTZ DEFAULT NOW()
 );
 
-CREATE INDEX IF NOT EXISTS idx_county_boundaries_statecd ON raw.county_boundaries(statecd);
+-- Covers the per-state "ORDER BY name" reads: rows come back pre-sorted from
+-- the index, and non-geometry columns never need a heap visit
+CREATE INDEX IF NOT EXISTS idx_county_boundaries_statecd_name
+    ON raw.county_boundaries(statecd, name) INCLUDE (geoid, countycd, aland, awater);
 CREATE INDEX IF NOT EXISTS idx_county_boundaries_geom ON raw.county_boundaries USING GIST(geom);
 
+-- Pre-simplified county geometry per zoom band (tolerance in degrees).
+-- Low-zoom maps read these instead of full-resolution TIGER polygons.
+-- Refreshed by tiger_loader after every load.
+CREATE MATERIALIZED VIEW IF NOT EXISTS raw.mv_county_boundaries_z4 AS
+SELECT geoid, name, statecd, countycd, aland, awater,
+       ST_SimplifyPreserveTopology(geom, 0.05) AS geom
+FROM raw.county_boundaries;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_county_z4_geoid ON raw.mv_county_boundaries_z4(geoid);
+CREATE INDEX IF NOT EXISTS idx_mv_county_z4_statecd_name ON raw.mv_county_boundaries_z4(statecd, name);
+CREATE INDEX IF NOT EXISTS idx_mv_county_z4_geom ON raw.mv_county_boundaries_z4 USING GIST(geom);
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS raw.mv_county_boundaries_z7 AS
+SELECT geoid, name, statecd, countycd, aland, awater,
+       ST_SimplifyPreserveTopology(geom, 0.01) AS geom
+FROM raw.county_boundaries;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_county_z7_geoid ON raw.mv_county_boundaries_z7(geoid);
+CREATE INDEX IF NOT EXISTS idx_mv_county_z7_statecd_name ON raw.mv_county_boundaries_z7(statecd, name);
+CREATE INDEX IF NOT EXISTS idx_mv_county_z7_geom ON raw.mv_county_boundaries_z7 USING GIST(geom);
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS raw.mv_county_boundaries_z10 AS
+SELECT geoid, name, statecd, countycd, aland, awater,
+       ST_SimplifyPreserveTopology(geom, 0.001) AS geom
+FROM raw.county_boundaries;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_county_z10_geoid ON raw.mv_county_boundaries_z10(geoid);
+CREATE INDEX IF NOT EXISTS idx_mv_county_z10_statecd_name ON raw.mv_county_boundaries_z10(statecd, name);
+CREATE INDEX IF NOT EXISTS idx_mv_county_z10_geom ON raw.mv_county_boundaries_z10 USING GIST(geom);
+
 -- PRISM 30-year climate normals sampled at FIA plot locations
 CREATE TABLE IF NOT EXISTS raw.prism_normals (
     plot_cn             BIGINT PRIMARY KEY REFERENCES raw.fia_plot(cn),
@@ -0,0 +1,28 @@
+-- Per-plot live-tree carbon behind /plots and /climate, refreshed by
+-- fia_loader after each state load so requests never re-aggregate fia_tree.
+--
+-- Safe to re-run against an existing database: the view is dropped and
+-- rebuilt (from whatever fia_tree already holds) with its indexes, so a
+-- changed definition actually lands instead of being skipped by IF NOT EXISTS.
+-- No CASCADE: if anything ever comes to depend on the view, this fails loudly.
+BEGIN;
+
+DROP MATERIALIZED VIEW IF EXISTS raw.mv_plot_carbon;
+
+CREATE MATERIALIZED VIEW raw.mv_plot_carbon AS
+SELECT plt_cn,
+       SUM(carbon_ag * tpa_unadj) AS carbon_ag_total,
+       SUM(COALESCE(carbon_bg, 0) * tpa_unadj) AS carbon_bg_total,
+       SUM(carbon_ag * tpa_unadj) / 2000.0 AS carbon_ag_tons,
+       COUNT(cn) AS tree_count,
+       MODE() WITHIN GROUP (ORDER BY spcd) AS dominant_spcd
+FROM raw.fia_tree
+WHERE statuscd = 1
+GROUP BY plt_cn;
+
+-- The unique index is what lets fia_loader REFRESH ... CONCURRENTLY
+CREATE UNIQUE INDEX idx_mv_plot_carbon_plt ON raw.mv_plot_carbon(plt_cn);
+CREATE INDEX idx_mv_plot_carbon_spcd ON raw.mv_plot_carbon(dominant_spcd);
+CREATE INDEX idx_mv_plot_carbon_ag ON raw.mv_plot_carbon(carbon_ag_total DESC);
+
+COMMIT;